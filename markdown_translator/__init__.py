@@ -9,13 +9,14 @@ __version__ = "0.1.0"
 __author__ = "Markdown Translator Team"
 __email__ = "contact@example.com"
 
-from .models import FileChunk, TranslationResult, ValidationResult, TranslationStats, MergeResult
+from .models import FileChunk, TranslationResult, ValidationResult, ValidationResultBatch, TranslationStats, MergeResult
 from .config import ConfigManager
 from .merger import ContentMerger
 from .progress import RichProgressReporter, TranslationLogger, UserFriendlyErrorReporter
 from .logging_config import setup_logging, get_logger, create_component_logger
 from .performance import PerformanceMonitor, PerformanceOptimizer
 from .security import SecurityManager, InputValidator
+from .cache import TranslationCache
 
 # TODO: Import these as they are implemented in future tasks
 # from .splitter import MarkdownSplitter
@@ -26,6 +27,7 @@ __all__ = [
     "FileChunk",
     "TranslationResult", 
     "ValidationResult",
+    "ValidationResultBatch",
     "TranslationStats",
     "MergeResult",
     "ConfigManager",
@@ -40,6 +42,7 @@ __all__ = [
     "PerformanceOptimizer",
     "SecurityManager",
     "InputValidator",
+    "TranslationCache",
     # TODO: Add these as they are implemented
     # "MarkdownSplitter",
     # "TranslationPool",
@@ -0,0 +1,253 @@
+"""
+Persistent cache of validated translations.
+
+This module stores translated chunk content keyed by a hash of the model name
+and translation prompt, so re-running a translation after editing a document
+only sends the chunks that actually changed to the API.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Trailing whitespace at the end of each line
+_TRAILING_SPACE_RE = re.compile(r'[ \t]+$', re.MULTILINE)
+
+# Two or more spaces ending a line, a Markdown hard line break
+_HARD_BREAK = '  '
+
+# Keys per SELECT in get_many, below SQLite's bound parameter limit
+_LOOKUP_BATCH_SIZE = 500
+
+# Runs of two or more blank lines
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
+
+def _normalize_trailing_space(match: 're.Match[str]') -> str:
+    """Drop trailing whitespace unless it is a hard line break."""
+    return _HARD_BREAK if match.group().endswith(_HARD_BREAK) else ''
+
+
+@functools.lru_cache(maxsize=32)
+def _key_prefix_hash(model_name: str, system_prompt: str) -> "hashlib._Hash":
+    """
+    Hash the fixed part of a cache key once per model and system prompt.
+    
+    Args:
+        model_name: Model the prompt is sent to
+        system_prompt: Fixed instructions sent ahead of the prompt
+        
+    Returns:
+        SHA-256 object to copy and extend with the prompt
+    """
+    return hashlib.sha256(f"{model_name}\0{system_prompt}".encode('utf-8'))
+
+
+class TranslationCache:
+    """
+    Exact-match translation cache backed by SQLite.
+    
+    Keys are SHA-256 digests of the model name and prompt, so a cached entry is
+    only reused for a byte-identical request to the same model. A second,
+    near-duplicate key is derived from whitespace-normalized content, so
+    chunks that differ only in trailing spaces or blank-line runs share an
+    entry. Cache errors are logged and treated as misses; they never fail a
+    translation.
+    """
+    
+    # Default cache location, shared by all runs of the translator
+    DEFAULT_PATH = os.path.join('~', '.cache', 'md-translator', 'translations.sqlite3')
+    
+    def __init__(self, path: Optional[str] = None, max_age: Optional[float] = None):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path to the SQLite database file (default: DEFAULT_PATH)
+            max_age: Seconds after which an entry is no longer used (default: never)
+        """
+        self.path = os.path.expanduser(path or self.DEFAULT_PATH)
+        self.max_age = max_age
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key BLOB PRIMARY KEY, content TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        except (OSError, sqlite3.Error) as e:
+            self.logger.warning("Translation cache disabled, cannot open %s: %s", self.path, e)
+    
+    @staticmethod
+    def make_key(model_name: str, prompt: str, system_prompt: str = "") -> bytes:
+        """
+        Compute the cache key for a translation request.
+        
+        The model name and system prompt are hashed once and the hash state
+        is reused, so only the prompt itself is hashed per request.
+        
+        Args:
+            model_name: Model the prompt is sent to
+            prompt: Translation prompt
+            system_prompt: Fixed instructions sent ahead of the prompt
+            
+        Returns:
+            SHA-256 digest identifying the request
+        """
+        digest = _key_prefix_hash(model_name, system_prompt).copy()
+        digest.update(prompt.encode('utf-8'))
+        return digest.digest()
+    
+    @staticmethod
+    def make_near_key(model_name: str, content: str) -> bytes:
+        """
+        Compute the near-duplicate cache key for chunk content.
+        
+        Trailing whitespace on each line, runs of blank lines and leading or
+        trailing blank lines are normalized away before hashing. Trailing
+        whitespace ending in two spaces is a hard line break and is kept (as
+        exactly two spaces). Text itself, including numbers, must match
+        exactly, since a reused translation would copy it verbatim.
+        
+        Args:
+            model_name: Model the content is translated with
+            content: Original chunk content
+            
+        Returns:
+            SHA-256 digest identifying the normalized content
+        """
+        normalized = _BLANK_RUN_RE.sub('\n\n', _TRAILING_SPACE_RE.sub(_normalize_trailing_space, content)).strip('\n')
+        return hashlib.sha256(f"near\0{model_name}\0{normalized}".encode('utf-8')).digest()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached translation.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Cached translated content, or None on a miss
+        """
+        if self._connection is None:
+            return None
+        
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT content, created FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.warning("Translation cache lookup failed: %s", e)
+            return None
+        
+        if row is None or (self.max_age is not None and time.time() - row[1] > self.max_age):
+            return None
+        content: str = row[0]
+        return content
+    
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        """
+        Look up several cached translations at once.
+        
+        Args:
+            keys: Cache keys from make_key or make_near_key
+            
+        Returns:
+            Cached translated content for each key that is present
+        """
+        if self._connection is None:
+            return {}
+        
+        keys = list(dict.fromkeys(keys))
+        found: Dict[bytes, str] = {}
+        oldest = time.time() - self.max_age if self.max_age is not None else None
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                    batch = keys[start:start + _LOOKUP_BATCH_SIZE]
+                    rows = self._connection.execute(
+                        "SELECT key, content, created FROM translations WHERE key IN (%s)"
+                        % ','.join('?' * len(batch)), batch
+                    ).fetchall()
+                    for key, content, created in rows:
+                        if oldest is None or created >= oldest:
+                            found[bytes(key)] = content
+        except sqlite3.Error as e:
+            self.logger.warning("Translation cache lookup failed: %s", e)
+            return {}
+        return found
+    
+    def set(self, key: bytes, content: str) -> None:
+        """
+        Store a validated translation.
+        
+        Args:
+            key: Cache key from make_key
+            content: Translated content, with integrity markers removed
+        """
+        if self._connection is None:
+            return
+        
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO translations (key, content, created) VALUES (?, ?, ?)",
+                    (key, content, time.time())
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning("Translation cache store failed: %s", e)
+    
+    def set_many(self, entries: List[Tuple[bytes, str]]) -> None:
+        """
+        Store several validated translations in one transaction.
+        
+        Args:
+            entries: (cache key, translated content) pairs
+        """
+        if self._connection is None or not entries:
+            return
+        
+        created = time.time()
+        try:
+            with self._lock:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO translations (key, content, created) VALUES (?, ?, ?)",
+                    [(key, content, created) for key, content in entries]
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning("Translation cache store failed: %s", e)
+    
+    def clear(self) -> None:
+        """Remove all cached translations."""
+        if self._connection is None:
+            return
+        
+        try:
+            with self._lock:
+                self._connection.execute("DELETE FROM translations")
+                self._connection.commit()
+        except sqlite3.Error as e:
+            self.logger.warning("Translation cache clear failed: %s", e)
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+                self._connection = None
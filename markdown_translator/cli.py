@@ -143,13 +143,16 @@ def validate_concurrency(ctx, param, value):
               help='Save checkpoint every N chunks (default: 10)')
 @click.option('--resume', is_flag=True,
               help='Resume from checkpoint if it exists')
+@click.option('--no-cache', is_flag=True,
+              help='Do not read or store translations in the on-disk cache')
 @click.option('--verbose', is_flag=True,
               help='Enable verbose logging')
 @click.option('--version', is_flag=True,
               help='Show version and exit')
 def main(input_file: str, output_file: Optional[str], chunk_size: Optional[int], concurrency: Optional[int],
          config_file: Optional[str], timeout: int, max_retries: int, retry_delay: int,
-         max_delay: int, checkpoint_interval: int, resume: bool, verbose: bool, version: bool):
+         max_delay: int, checkpoint_interval: int, resume: bool, no_cache: bool, verbose: bool,
+         version: bool):
     """
     Translate Markdown files to Chinese using AI.
     
@@ -222,6 +225,7 @@ def main(input_file: str, output_file: Optional[str], chunk_size: Optional[int],
             console.print(f"  Max delay: {max_delay}s")
             console.print(f"  Checkpoint interval: {checkpoint_interval} chunks")
             console.print(f"  Resume: {resume}")
+            console.print(f"  Cache: {'disabled' if no_cache else 'enabled'}")
             console.print(f"  Verbose: {verbose}")
         
         # Handle resume mode
@@ -230,7 +234,7 @@ def main(input_file: str, output_file: Optional[str], chunk_size: Optional[int],
             checkpoint_path = Path(output_file).with_suffix('.chkpt.json')
             if checkpoint_path.exists():
                 console.print(f"[blue]Resuming translation from checkpoint: {checkpoint_path}[/blue]")
-                return asyncio.run(resume_translation(str(checkpoint_path), verbose))
+                return asyncio.run(resume_translation(str(checkpoint_path), verbose, use_cache=not no_cache))
             else:
                 console.print(f"[yellow]Checkpoint file not found: {checkpoint_path}. Starting new translation.[/yellow]")
         
@@ -247,14 +251,16 @@ def main(input_file: str, output_file: Optional[str], chunk_size: Optional[int],
             checkpoint_interval=checkpoint_interval,
             verbose=verbose,
             shutdown_event=shutdown_event,
-            config_manager=config_manager
+            config_manager=config_manager,
+            use_cache=not no_cache
         ))
 
 
 async def run_translation(input_file: str, output_file: str, chunk_size: int, 
                          concurrency: int, timeout: int, max_retries: int, 
                          retry_delay: int, max_delay: int, checkpoint_interval: int,
-                         verbose: bool, shutdown_event: asyncio.Event, config_manager: ConfigManager):
+                         verbose: bool, shutdown_event: asyncio.Event, config_manager: ConfigManager,
+                         use_cache: bool = True):
     """
     Run the main translation process.
     
@@ -271,7 +277,9 @@ async def run_translation(input_file: str, output_file: str, chunk_size: int,
         verbose: Enable verbose logging
         shutdown_event: Event for graceful shutdown
         config_manager: Configuration manager instance
+        use_cache: Whether to use the on-disk translation cache
     """
+    engine = None
     try:
         # Setup logging
         logger = setup_logging(verbose=verbose)
@@ -281,7 +289,8 @@ async def run_translation(input_file: str, output_file: str, chunk_size: int,
         engine = create_translation_engine(
             chunk_size=chunk_size if chunk_size is not None else 500,
             concurrency=concurrency if concurrency is not None else 5,
-            verbose=verbose
+            verbose=verbose,
+            use_cache=use_cache
         )
         
         # Progress callback
@@ -362,16 +371,21 @@ async def run_translation(input_file: str, output_file: str, chunk_size: int,
             import traceback
             console.print(f"[red]{traceback.format_exc()}[/red]")
         return 1
+    finally:
+        if engine is not None:
+            engine.close()
 
 
-async def resume_translation(checkpoint_path: str, verbose: bool):
+async def resume_translation(checkpoint_path: str, verbose: bool, use_cache: bool = True):
     """
     Resume translation from a checkpoint.
     
     Args:
         checkpoint_path: Path to checkpoint file
         verbose: Enable verbose logging
+        use_cache: Whether to use the on-disk translation cache
     """
+    engine = None
     try:
         # Setup logging
         log_level = "DEBUG" if verbose else "INFO"
@@ -379,7 +393,7 @@ async def resume_translation(checkpoint_path: str, verbose: bool):
         
         # Create translation engine
         console.print("[blue]Initializing translation engine...[/blue]")
-        engine = create_translation_engine(verbose=verbose)
+        engine = create_translation_engine(verbose=verbose, use_cache=use_cache)
         
         # Resume translation
         console.print(f"[blue]Resuming translation from {checkpoint_path}...[/blue]")
@@ -426,6 +440,9 @@ async def resume_translation(checkpoint_path: str, verbose: bool):
             import traceback
             console.print(f"[red]{traceback.format_exc()}[/red]")
         return 1
+    finally:
+        if engine is not None:
+            engine.close()
 
 
 def cli_entry_point():
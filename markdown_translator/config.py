@@ -7,7 +7,7 @@ and provides access to API clients and other configuration values.
 
 import os
 from typing import Dict, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import yaml
 from .interfaces import IConfigManager
 
@@ -47,6 +47,7 @@ class ConfigManager(IConfigManager):
         """Initialize the configuration manager."""
         self._config: Dict[str, Any] = {}
         self._api_client: Optional[OpenAI] = None
+        self._async_api_client: Optional[AsyncOpenAI] = None
         self.config_file = config_file
         self._load_config()
     
@@ -211,6 +212,28 @@ class ConfigManager(IConfigManager):
             self._api_client = self._create_api_client()
         return self._api_client
     
+    def get_async_api_client(self) -> AsyncOpenAI:
+        """
+        Get a configured async API client for translation services.
+        
+        The client keeps one pooled HTTP connection set, so concurrent
+        requests are awaited directly instead of each occupying a thread.
+        
+        Returns:
+            Configured AsyncOpenAI client object
+            
+        Raises:
+            ValueError: If API configuration is invalid
+        """
+        if self._async_api_client is None:
+            if not self._config.get('TRANSLATE_API_TOKEN') or not self._config.get('TRANSLATE_API'):
+                raise ValueError("Invalid API configuration")
+            self._async_api_client = AsyncOpenAI(
+                api_key=self._config['TRANSLATE_API_TOKEN'],
+                base_url=self._config['TRANSLATE_API']
+            )
+        return self._async_api_client
+    
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value by key.
@@ -240,4 +263,5 @@ class ConfigManager(IConfigManager):
         """Reload configuration from environment variables."""
         self._config.clear()
         self._api_client = None
+        self._async_api_client = None
         self._load_config()
\ No newline at end of file
@@ -30,6 +30,7 @@ from .progress import RichProgressReporter
 from .logging_config import setup_logging
 from .performance import PerformanceMonitor, PerformanceOptimizer
 from .security import SecurityManager
+from .cache import TranslationCache
 
 
 class TranslationEngine:
@@ -53,7 +54,9 @@ class TranslationEngine:
                  progress_reporter: Optional[IProgressReporter] = None,
                  performance_monitor: Optional[PerformanceMonitor] = None,
                  security_manager: Optional[SecurityManager] = None,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 cache: Optional[TranslationCache] = None,
+                 use_cache: bool = True):
         """
         Initialize the translation engine with all required components.
         
@@ -67,6 +70,10 @@ class TranslationEngine:
             performance_monitor: Performance monitoring (creates default if None)
             security_manager: Security manager (creates default if None)
             logger: Logger instance (creates default if None)
+            cache: Translation cache, closed by close() (creates default for
+                the default translator if None and use_cache is set)
+            use_cache: Whether translations are read from and stored in the
+                on-disk cache (default: True)
         """
         # Initialize logger first
         self.logger = logger or logging.getLogger(__name__)
@@ -75,7 +82,7 @@ class TranslationEngine:
         self.config_manager = config_manager or ConfigManager()
         self.validator = validator or IntegrityValidator()
         self.merger = merger or ContentMerger(logger=self.logger)
-        self.progress_reporter = progress_reporter or RichProgressReporter()
+        self.progress_reporter = progress_reporter or RichProgressReporter.default()
         
         # Initialize performance monitoring and security
         self.performance_monitor = performance_monitor or PerformanceMonitor()
@@ -85,17 +92,25 @@ class TranslationEngine:
         # Initialize splitter with default chunk size
         self.splitter = splitter or MarkdownSplitter(chunk_size=500)
         
+        # Only the default translator gets a default cache; a given translator
+        # brings its own
+        if cache is None and use_cache and not translator:
+            cache = TranslationCache()
+        self.cache = cache if use_cache else None
+        
         # Initialize translator with API client, validator, performance monitor, and security
         if translator:
             self.translator = translator
         else:
-            api_client = self.config_manager.get_api_client()
+            api_client = self.config_manager.get_async_api_client()
             self.translator = TranslationPool(
                 concurrency=5,
                 api_client=api_client,
                 validator=self.validator,
                 performance_monitor=self.performance_monitor,
-                security_manager=self.security_manager
+                security_manager=self.security_manager,
+                cache=self.cache,
+                model_name=self.config_manager.get_model_name()
             )
         
         # Translation state
@@ -148,6 +163,11 @@ class TranslationEngine:
             # Validate inputs
             self._validate_translation_inputs(input_path, output_path)
             
+            # Capture optimizer inputs once when either setting needs a suggestion
+            optimizer_snapshot = None
+            if chunk_size is None or concurrency is None:
+                optimizer_snapshot = self.performance_optimizer.snapshot()
+            
             # Configure components if overrides provided
             if chunk_size is not None:
                 # User manually specified chunk size - use it directly without optimization
@@ -156,7 +176,9 @@ class TranslationEngine:
             else:
                 # No chunk size specified - use optimizer to suggest optimal size
                 current_chunk_size = self.splitter.get_chunk_size()
-                optimal_chunk_size = self.performance_optimizer.suggest_optimal_chunk_size(current_chunk_size)
+                optimal_chunk_size = self.performance_optimizer.suggest_optimal_chunk_size(
+                    current_chunk_size, optimizer_snapshot
+                )
                 if optimal_chunk_size != current_chunk_size:
                     self.logger.info(f"Performance optimizer suggests chunk size: {optimal_chunk_size} (current: {current_chunk_size})")
                     self.splitter.set_chunk_size(optimal_chunk_size)
@@ -169,7 +191,9 @@ class TranslationEngine:
             else:
                 # No concurrency specified - use optimizer to suggest optimal concurrency
                 current_concurrency = self.translator.get_concurrency()
-                optimal_concurrency = self.performance_optimizer.suggest_optimal_concurrency(current_concurrency)
+                optimal_concurrency = self.performance_optimizer.suggest_optimal_concurrency(
+                    current_concurrency, optimizer_snapshot
+                )
                 if optimal_concurrency != current_concurrency:
                     self.logger.info(f"Performance optimizer suggests concurrency: {optimal_concurrency} (current: {current_concurrency})")
                     self.translator.set_concurrency(optimal_concurrency)
@@ -419,10 +443,19 @@ class TranslationEngine:
             List of TranslationResult objects
         """
         try:
+            def on_result(result: TranslationResult) -> None:
+                if self.current_progress:
+                    self.current_progress.completed_chunks += 1
+                    self.current_progress.current_chunk_id = result.chunk_id
+            
             # Create progress tracking wrapper
             async def progress_wrapper():
-                # Start translation
-                task = asyncio.create_task(self.translator.translate_chunks(chunks))
+                # Start translation; results are counted as they arrive
+                if isinstance(self.translator, TranslationPool):
+                    translation = self.translator.translate_chunks(chunks, on_result=on_result)
+                else:
+                    translation = self.translator.translate_chunks(chunks)
+                task = asyncio.create_task(translation)
                 
                 # Monitor progress
                 while not task.done():
@@ -550,11 +583,18 @@ class TranslationEngine:
             "model_name": self.config_manager.get_config_value("TRANSLATE_MODEL"),
             "current_progress": self.current_progress.completion_percentage if self.current_progress else 0
         }
+    
+    def close(self) -> None:
+        """Close the translation cache, if the engine has one."""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
 
 
 def create_translation_engine(chunk_size: int = 500, 
                             concurrency: int = 5,
-                            verbose: bool = False) -> TranslationEngine:
+                            verbose: bool = False,
+                            use_cache: bool = True) -> TranslationEngine:
     """
     Factory function to create a configured TranslationEngine.
     
@@ -562,6 +602,8 @@ def create_translation_engine(chunk_size: int = 500,
         chunk_size: Chunk size for file splitting
         concurrency: Concurrency level for translation
         verbose: Enable verbose logging
+        use_cache: Whether translations are read from and stored in the
+            on-disk cache
         
     Returns:
         Configured TranslationEngine instance
@@ -574,22 +616,23 @@ def create_translation_engine(chunk_size: int = 500,
     splitter = MarkdownSplitter(chunk_size=chunk_size)
     validator = IntegrityValidator()
     merger = ContentMerger(logger=logger)
-    progress_reporter = RichProgressReporter()
+    progress_reporter = RichProgressReporter.default()
     
     # Create performance monitoring and security components
     performance_monitor = PerformanceMonitor()
     security_manager = SecurityManager()
     
     # Create translator with API client, performance monitor, and security
-    api_client = config_manager.get_api_client()
-    # Attach config manager to API client so translator can access it
-    api_client._config_manager = config_manager
+    cache = TranslationCache() if use_cache else None
+    api_client = config_manager.get_async_api_client()
     translator = TranslationPool(
         concurrency=concurrency,
         api_client=api_client,
         validator=validator,
         performance_monitor=performance_monitor,
-        security_manager=security_manager
+        security_manager=security_manager,
+        cache=cache,
+        model_name=config_manager.get_model_name()
     )
     
     # Create engine
@@ -602,7 +645,9 @@ def create_translation_engine(chunk_size: int = 500,
         progress_reporter=progress_reporter,
         performance_monitor=performance_monitor,
         security_manager=security_manager,
-        logger=logger
+        logger=logger,
+        cache=cache,
+        use_cache=use_cache
     )
     
     return engine
@@ -201,6 +201,28 @@ class IConfigManager(ABC):
         """
         pass
     
+    def get_async_api_client(self) -> Any:
+        """
+        Get an API client whose calls can be awaited directly.
+        
+        Implementations without an async client fall back to the regular
+        client, which callers run in a worker thread.
+        
+        Returns:
+            Configured API client object
+        """
+        return self.get_api_client()
+    
+    @abstractmethod
+    def get_model_name(self) -> str:
+        """
+        Get the model name to use for translation.
+        
+        Returns:
+            Model name passed to the API
+        """
+        pass
+    
     @abstractmethod
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """
@@ -11,10 +11,9 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
-from rich.console import Console
 from rich.logging import RichHandler
 
-from .progress import TranslationLogger
+from .progress import TranslationLogger, _get_default_console
 
 
 class LoggingConfig:
@@ -37,7 +36,7 @@ class LoggingConfig:
     def __init__(self):
         """Initialize the logging configuration manager."""
         self._loggers: Dict[str, TranslationLogger] = {}
-        self._console = Console()
+        self._console = _get_default_console()
     
     def setup_logging(
         self,
@@ -172,9 +171,7 @@ class LoggingConfig:
         Shutdown all loggers and clean up resources.
         """
         for logger in self._loggers.values():
-            for handler in logger.logger.handlers[:]:
-                handler.close()
-                logger.logger.removeHandler(handler)
+            logger.close()
         
         self._loggers.clear()
 
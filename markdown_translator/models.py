@@ -5,7 +5,8 @@ This module defines the data structures used throughout the translation process,
 including file chunks, translation results, validation results, and statistics.
 """
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from typing import List, Optional
 from enum import Enum
 
@@ -32,6 +33,8 @@ class FileChunk:
         original_file: Path to the original file
         sequence_number: Sequential number for ordering (0-based)
         temp_file: Path to temporary file (if created)
+        no_cache: Keep this chunk's content and translation out of the
+            translation cache (for sensitive content)
     """
     id: str
     content: str
@@ -40,6 +43,7 @@ class FileChunk:
     original_file: str
     sequence_number: int = 0
     temp_file: Optional[str] = None
+    no_cache: bool = False
 
 
 @dataclass
@@ -49,7 +53,8 @@ class TranslationResult:
     
     Attributes:
         chunk_id: ID of the chunk that was translated
-        original_content: Original content before translation
+        original_content: Original content before translation (the chunk's
+            own string, shared rather than copied)
         translated_content: Translated content
         success: Whether the translation was successful
         sequence_number: Sequential number for ordering (0-based)
@@ -88,6 +93,42 @@ class ValidationResult:
     has_markers: bool = False
 
 
+@dataclass
+class ValidationResultBatch:
+    """
+    Many validation results stored column by column.
+    
+    Only the fields used for statistics are kept, each in a compact typed
+    array, so large batches take little memory and aggregate without
+    touching a Python object per result.
+    
+    Attributes:
+        is_valid: 1 for each passed validation, 0 otherwise
+        confidence: Confidence score of each validation
+        issue_counts: Number of issues found by each validation
+        line_diffs: Line count difference of each validation
+    """
+    is_valid: array = field(default_factory=lambda: array('b'))
+    confidence: array = field(default_factory=lambda: array('d'))
+    issue_counts: array = field(default_factory=lambda: array('i'))
+    line_diffs: array = field(default_factory=lambda: array('i'))
+    
+    def append(self, result: ValidationResult) -> None:
+        """
+        Add a validation result to the batch.
+        
+        Args:
+            result: Validation result to add
+        """
+        self.is_valid.append(result.is_valid)
+        self.confidence.append(result.confidence_score)
+        self.issue_counts.append(len(result.issues))
+        self.line_diffs.append(result.line_count_diff)
+    
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+
 @dataclass
 class TranslationStats:
     """
@@ -8,28 +8,64 @@ API response time monitoring, and performance optimization recommendations.
 import time
 import psutil
 import threading
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
-from collections import defaultdict, deque
-from statistics import mean, median
+from array import array
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from dataclasses import dataclass, field, replace
 import logging
 
 
+def _summarize(samples: Sequence[float]) -> Tuple[float, float, float]:
+    """
+    Compute mean, median and max of a sample buffer.
+    
+    Uses the C-level ``sum``/``sorted``/``max`` builtins instead of the
+    pure-Python ``statistics`` helpers.
+    
+    Args:
+        samples: Sample buffer to summarize
+        
+    Returns:
+        Tuple of (mean, median, max), all 0.0 for an empty buffer
+    """
+    n = len(samples)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    
+    ordered = sorted(samples)
+    mid = n // 2
+    if n % 2:
+        median_value = float(ordered[mid])
+    else:
+        median_value = (ordered[mid - 1] + ordered[mid]) / 2
+    
+    return sum(samples) / n, median_value, float(ordered[-1])
+
+
 @dataclass
 class PerformanceMetrics:
-    """Container for performance metrics."""
-    api_response_times: List[float] = field(default_factory=list)
-    chunk_processing_times: List[float] = field(default_factory=list)
-    memory_usage_samples: List[float] = field(default_factory=list)
-    error_rates: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
-    concurrent_operations: List[int] = field(default_factory=list)
-    throughput_samples: List[float] = field(default_factory=list)
+    """
+    Container for performance metrics.
+
+    Sample buffers are typed arrays so each sample is stored as a raw C value
+    rather than a boxed Python object.
+    """
+    api_response_times: 'array[float]' = field(default_factory=lambda: array('d'))
+    chunk_processing_times: 'array[float]' = field(default_factory=lambda: array('d'))
+    memory_usage_samples: 'array[float]' = field(default_factory=lambda: array('d'))
+    concurrent_operations: 'array[int]' = field(default_factory=lambda: array('q'))
+    throughput_samples: 'array[float]' = field(default_factory=lambda: array('d'))
+    api_errors: int = 0
+    
+    @property
+    def error_rates(self) -> Dict[str, int]:
+        """Error counters keyed by error type."""
+        return {'api_errors': self.api_errors}
     
     def add_api_response_time(self, duration: float, success: bool) -> None:
         """Record an API response time."""
         self.api_response_times.append(duration)
         if not success:
-            self.error_rates['api_errors'] += 1
+            self.api_errors += 1
     
     def add_chunk_processing_time(self, duration: float) -> None:
         """Record chunk processing time."""
@@ -65,6 +101,14 @@ class PerformanceReport:
     total_samples: int
 
 
+@dataclass
+class PerformanceSnapshot:
+    """Point-in-time view of the metrics used for optimizer decisions."""
+    report: PerformanceReport
+    system_memory: Dict[str, float]
+    current_memory_mb: float
+
+
 class PerformanceMonitor:
     """
     Performance monitoring system for the Markdown translator.
@@ -73,6 +117,9 @@ class PerformanceMonitor:
     memory usage, processing times, and provides optimization recommendations.
     """
     
+    # Minimum number of nanoseconds between two memory samples
+    MEMORY_SAMPLE_INTERVAL_NS = 1_000_000_000
+    
     def __init__(self, sample_window_size: int = 1000):
         """
         Initialize the performance monitor.
@@ -82,10 +129,13 @@ class PerformanceMonitor:
         """
         self.sample_window_size = sample_window_size
         self.metrics = PerformanceMetrics()
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         self.logger = logging.getLogger(__name__)
-        self._monitoring_active = False
-        self._memory_monitor_thread = None
+        self._monitoring_active = threading.Event()
+        self._process = psutil.Process()
+        self._last_mem_sample_ns = -self.MEMORY_SAMPLE_INTERVAL_NS
+        self._last_mem_mb = 0.0
+        self._last_mem_read_ns = -self.MEMORY_SAMPLE_INTERVAL_NS
         self._lock = threading.Lock()
         
         # Performance thresholds for recommendations
@@ -95,46 +145,98 @@ class PerformanceMonitor:
             'error_rate_high': 5.0,         # percentage
             'low_throughput': 1.0           # chunks per second
         }
+        self._bind_thresholds()
+        
+        # Template copied while no samples have been recorded
+        self._empty_report = PerformanceReport(
+            avg_api_response_time=0.0,
+            median_api_response_time=0.0,
+            max_api_response_time=0.0,
+            avg_chunk_processing_time=0.0,
+            median_chunk_processing_time=0.0,
+            peak_memory_usage_mb=0.0,
+            avg_memory_usage_mb=0.0,
+            error_rate_percentage=0.0,
+            avg_concurrent_operations=0.0,
+            avg_throughput_chunks_per_second=0.0,
+            recommendations=["No performance samples collected yet."],
+            total_samples=0
+        )
+    
+    def _bind_thresholds(self) -> None:
+        """Copy thresholds to attributes so hot paths skip the dict lookup."""
+        self._th_api_slow = self.thresholds['api_response_time_slow']
+        self._th_mem_high = self.thresholds['memory_usage_high']
+        self._th_err_high = self.thresholds['error_rate_high']
+        self._th_low_tp = self.thresholds['low_throughput']
+    
+    def set_threshold(self, name: str, value: float) -> None:
+        """
+        Update a performance threshold.
+        
+        Args:
+            name: Threshold name (key in thresholds)
+            value: New threshold value
+            
+        Raises:
+            ValueError: If the threshold name is unknown
+        """
+        if name not in self.thresholds:
+            raise ValueError(f"Unknown performance threshold: {name}")
+        self.thresholds[name] = value
+        self._bind_thresholds()
     
     def start_monitoring(self) -> None:
-        """Start continuous performance monitoring."""
+        """
+        Start continuous performance monitoring.
+        
+        Memory is sampled on demand from record_chunk_processing, at most
+        once per MEMORY_SAMPLE_INTERVAL_NS, rather than by a dedicated
+        background thread.
+        """
         with self._lock:
-            if self._monitoring_active:
+            if self._monitoring_active.is_set():
                 return
             
-            self._monitoring_active = True
-            self._memory_monitor_thread = threading.Thread(
-                target=self._monitor_memory_usage,
-                daemon=True
-            )
-            self._memory_monitor_thread.start()
-            self.logger.info("Performance monitoring started")
+            self._monitoring_active.set()
+            self._last_mem_sample_ns = -self.MEMORY_SAMPLE_INTERVAL_NS
+        
+        # Take a baseline sample so short runs still report memory usage
+        self._maybe_sample_memory()
+        self.logger.info("Performance monitoring started")
     
     def stop_monitoring(self) -> None:
         """Stop continuous performance monitoring."""
+        # Event.clear() is atomic, so stopping never waits on the metrics lock
+        self._monitoring_active.clear()
+        self.logger.info("Performance monitoring stopped")
+    
+    def _maybe_sample_memory(self) -> None:
+        """Record a memory sample if monitoring is active and the last one is stale."""
+        if not self._monitoring_active.is_set():
+            return
+        
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_mem_sample_ns < self.MEMORY_SAMPLE_INTERVAL_NS:
+            return
+        self._last_mem_sample_ns = now_ns
+        
+        try:
+            memory_mb = self._read_process_memory()
+        except Exception as e:
+            self.logger.warning("Error monitoring memory usage: %s", e)
+            return
+        
         with self._lock:
-            self._monitoring_active = False
-            if self._memory_monitor_thread:
-                self._memory_monitor_thread.join(timeout=1.0)
-            self.logger.info("Performance monitoring stopped")
-    
-    def _monitor_memory_usage(self) -> None:
-        """Background thread to monitor memory usage."""
-        process = psutil.Process()
-        
-        while self._monitoring_active:
-            try:
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
-                
-                with self._lock:
-                    self.metrics.add_memory_sample(memory_mb)
-                    self._trim_samples()
-                
-                time.sleep(1.0)  # Sample every second
-            except Exception as e:
-                self.logger.warning(f"Error monitoring memory usage: {e}")
-                time.sleep(5.0)  # Wait longer on error
+            self.metrics.add_memory_sample(memory_mb)
+            self._trim_samples()
+    
+    def _read_process_memory(self) -> float:
+        """Read the process RSS in MB and remember it for get_current_memory_usage."""
+        memory_mb = self._process.memory_info().rss / 1024 / 1024  # Convert to MB
+        self._last_mem_mb = memory_mb
+        self._last_mem_read_ns = time.monotonic_ns()
+        return memory_mb
     
     def record_api_call(self, duration: float, success: bool) -> None:
         """
@@ -148,8 +250,8 @@ class PerformanceMonitor:
             self.metrics.add_api_response_time(duration, success)
             self._trim_samples()
         
-        if duration > self.thresholds['api_response_time_slow']:
-            self.logger.warning(f"Slow API response detected: {duration:.2f}s")
+        if duration > self._th_api_slow and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("Slow API response detected: %.2fs", duration)
     
     def record_chunk_processing(self, duration: float) -> None:
         """
@@ -161,6 +263,8 @@ class PerformanceMonitor:
         with self._lock:
             self.metrics.add_chunk_processing_time(duration)
             self._trim_samples()
+        
+        self._maybe_sample_memory()
     
     def record_concurrent_operations(self, count: int) -> None:
         """
@@ -191,15 +295,19 @@ class PerformanceMonitor:
         """
         Get current memory usage in MB.
         
+        Reuses the most recent reading (including the one taken by the
+        memory sampler) when it is less than MEMORY_SAMPLE_INTERVAL_NS old.
+        
         Returns:
             Current memory usage in megabytes
         """
+        if time.monotonic_ns() - self._last_mem_read_ns < self.MEMORY_SAMPLE_INTERVAL_NS:
+            return self._last_mem_mb
+        
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            return memory_info.rss / 1024 / 1024
+            return self._read_process_memory()
         except Exception as e:
-            self.logger.warning(f"Error getting memory usage: {e}")
+            self.logger.warning("Error getting memory usage: %s", e)
             return 0.0
     
     def get_system_memory_info(self) -> Dict[str, float]:
@@ -218,64 +326,71 @@ class PerformanceMonitor:
                 'percentage': memory.percent
             }
         except Exception as e:
-            self.logger.warning(f"Error getting system memory info: {e}")
+            self.logger.warning("Error getting system memory info: %s", e)
             return {}
     
     def _trim_samples(self) -> None:
-        """Trim sample lists to maintain window size."""
-        if len(self.metrics.api_response_times) > self.sample_window_size:
-            self.metrics.api_response_times = self.metrics.api_response_times[-self.sample_window_size:]
-        
-        if len(self.metrics.chunk_processing_times) > self.sample_window_size:
-            self.metrics.chunk_processing_times = self.metrics.chunk_processing_times[-self.sample_window_size:]
-        
-        if len(self.metrics.memory_usage_samples) > self.sample_window_size:
-            self.metrics.memory_usage_samples = self.metrics.memory_usage_samples[-self.sample_window_size:]
-        
-        if len(self.metrics.concurrent_operations) > self.sample_window_size:
-            self.metrics.concurrent_operations = self.metrics.concurrent_operations[-self.sample_window_size:]
-        
-        if len(self.metrics.throughput_samples) > self.sample_window_size:
-            self.metrics.throughput_samples = self.metrics.throughput_samples[-self.sample_window_size:]
+        """Trim sample buffers to maintain window size."""
+        window = self.sample_window_size
+        metrics = self.metrics
+        for samples in (
+            metrics.api_response_times,
+            metrics.chunk_processing_times,
+            metrics.memory_usage_samples,
+            metrics.concurrent_operations,
+            metrics.throughput_samples,
+        ):
+            if len(samples) > window:
+                # In-place deletion keeps the same array object
+                del samples[:-window]
     
     def generate_performance_report(self) -> PerformanceReport:
         """
         Generate a comprehensive performance report.
         
+        Each call returns a new report that the caller owns. Reports are not
+        pooled: one shared instance would change under any caller or thread
+        still holding an earlier report.
+        
         Returns:
             PerformanceReport with analysis and recommendations
         """
         with self._lock:
             metrics = self.metrics
             
+            # Nothing recorded yet: skip the stats and the psutil lookup
+            if not (metrics.api_response_times or metrics.chunk_processing_times or
+                    metrics.memory_usage_samples or metrics.concurrent_operations or
+                    metrics.throughput_samples):
+                return replace(
+                    self._empty_report,
+                    recommendations=list(self._empty_report.recommendations)
+                )
+            
             # Calculate API response time statistics
             api_times = metrics.api_response_times
-            avg_api_time = mean(api_times) if api_times else 0.0
-            median_api_time = median(api_times) if api_times else 0.0
-            max_api_time = max(api_times) if api_times else 0.0
+            avg_api_time, median_api_time, max_api_time = _summarize(api_times)
             
             # Calculate chunk processing statistics
             chunk_times = metrics.chunk_processing_times
-            avg_chunk_time = mean(chunk_times) if chunk_times else 0.0
-            median_chunk_time = median(chunk_times) if chunk_times else 0.0
+            avg_chunk_time, median_chunk_time, _ = _summarize(chunk_times)
             
             # Calculate memory statistics
             memory_samples = metrics.memory_usage_samples
-            peak_memory = max(memory_samples) if memory_samples else 0.0
-            avg_memory = mean(memory_samples) if memory_samples else 0.0
+            avg_memory, _, peak_memory = _summarize(memory_samples)
             
             # Calculate error rate
             total_api_calls = len(api_times)
-            api_errors = metrics.error_rates.get('api_errors', 0)
+            api_errors = metrics.api_errors
             error_rate = (api_errors / total_api_calls * 100) if total_api_calls > 0 else 0.0
             
             # Calculate concurrency statistics
             concurrent_ops = metrics.concurrent_operations
-            avg_concurrent = mean(concurrent_ops) if concurrent_ops else 0.0
+            avg_concurrent = sum(concurrent_ops) / len(concurrent_ops) if concurrent_ops else 0.0
             
             # Calculate throughput statistics
             throughput_samples = metrics.throughput_samples
-            avg_throughput = mean(throughput_samples) if throughput_samples else 0.0
+            avg_throughput = sum(throughput_samples) / len(throughput_samples) if throughput_samples else 0.0
             
             # Generate recommendations
             recommendations = self._generate_recommendations(
@@ -303,31 +418,31 @@ class PerformanceMonitor:
                                 error_rate: float, avg_throughput: float, 
                                 avg_concurrent: float) -> List[str]:
         """Generate performance optimization recommendations."""
-        recommendations = []
+        recommendations: List[str] = []
         
         # API performance recommendations
-        if avg_api_time > self.thresholds['api_response_time_slow']:
+        if avg_api_time > self._th_api_slow:
             recommendations.append(
                 f"API response time is slow ({avg_api_time:.2f}s). "
                 "Consider reducing concurrency or checking network connectivity."
             )
         
         # Memory usage recommendations
-        if peak_memory > self.thresholds['memory_usage_high']:
+        if peak_memory > self._th_mem_high:
             recommendations.append(
                 f"High memory usage detected ({peak_memory:.1f}MB). "
                 "Consider reducing chunk size or processing fewer chunks concurrently."
             )
         
         # Error rate recommendations
-        if error_rate > self.thresholds['error_rate_high']:
+        if error_rate > self._th_err_high:
             recommendations.append(
                 f"High error rate detected ({error_rate:.1f}%). "
                 "Check API configuration and network stability."
             )
         
         # Throughput recommendations
-        if avg_throughput < self.thresholds['low_throughput']:
+        if avg_throughput < self._th_low_tp:
             recommendations.append(
                 f"Low throughput detected ({avg_throughput:.2f} chunks/s). "
                 "Consider increasing concurrency if system resources allow."
@@ -360,22 +475,22 @@ class PerformanceMonitor:
         report = self.generate_performance_report()
         
         self.logger.info("=== Performance Summary ===")
-        self.logger.info(f"Average API Response Time: {report.avg_api_response_time:.2f}s")
-        self.logger.info(f"Peak Memory Usage: {report.peak_memory_usage_mb:.1f}MB")
-        self.logger.info(f"Error Rate: {report.error_rate_percentage:.1f}%")
-        self.logger.info(f"Average Throughput: {report.avg_throughput_chunks_per_second:.2f} chunks/s")
-        self.logger.info(f"Total Samples: {report.total_samples}")
+        self.logger.info("Average API Response Time: %.2fs", report.avg_api_response_time)
+        self.logger.info("Peak Memory Usage: %.1fMB", report.peak_memory_usage_mb)
+        self.logger.info("Error Rate: %.1f%%", report.error_rate_percentage)
+        self.logger.info("Average Throughput: %.2f chunks/s", report.avg_throughput_chunks_per_second)
+        self.logger.info("Total Samples: %d", report.total_samples)
         
         if report.recommendations:
             self.logger.info("Recommendations:")
             for i, rec in enumerate(report.recommendations, 1):
-                self.logger.info(f"  {i}. {rec}")
+                self.logger.info("  %d. %s", i, rec)
     
     def reset_metrics(self) -> None:
         """Reset all performance metrics."""
         with self._lock:
             self.metrics = PerformanceMetrics()
-            self.start_time = time.time()
+            self.start_time_ns = time.monotonic_ns()
         self.logger.info("Performance metrics reset")
     
     def export_metrics(self) -> Dict[str, Any]:
@@ -385,15 +500,18 @@ class PerformanceMonitor:
         Returns:
             Dictionary containing all performance metrics
         """
+        monitoring_duration = (time.monotonic_ns() - self.start_time_ns) * 1e-9
+        
+        # tolist() unboxes each typed array in one C loop, keeping the lock short
         with self._lock:
             return {
-                'api_response_times': self.metrics.api_response_times.copy(),
-                'chunk_processing_times': self.metrics.chunk_processing_times.copy(),
-                'memory_usage_samples': self.metrics.memory_usage_samples.copy(),
-                'error_rates': dict(self.metrics.error_rates),
-                'concurrent_operations': self.metrics.concurrent_operations.copy(),
-                'throughput_samples': self.metrics.throughput_samples.copy(),
-                'monitoring_duration': time.time() - self.start_time,
+                'api_response_times': self.metrics.api_response_times.tolist(),
+                'chunk_processing_times': self.metrics.chunk_processing_times.tolist(),
+                'memory_usage_samples': self.metrics.memory_usage_samples.tolist(),
+                'error_rates': self.metrics.error_rates,
+                'concurrent_operations': self.metrics.concurrent_operations.tolist(),
+                'throughput_samples': self.metrics.throughput_samples.tolist(),
+                'monitoring_duration': monitoring_duration,
                 'sample_window_size': self.sample_window_size
             }
 
@@ -415,88 +533,122 @@ class PerformanceOptimizer:
         """
         self.monitor = performance_monitor
         self.logger = logging.getLogger(__name__)
+        # CPU count does not change during a run
+        self._cpu_count = psutil.cpu_count() or 1
     
-    def suggest_optimal_concurrency(self, current_concurrency: int) -> int:
+    def snapshot(self) -> PerformanceSnapshot:
+        """
+        Capture the report and memory readings used by the optimizer.
+        
+        Passing one snapshot to several decision methods lets callers make
+        all of them from a single set of psutil reads.
+        
+        Returns:
+            PerformanceSnapshot with the current report and memory readings
+        """
+        report = self.monitor.generate_performance_report()
+        return PerformanceSnapshot(
+            report=report,
+            system_memory=self.monitor.get_system_memory_info(),
+            current_memory_mb=self.monitor.get_current_memory_usage()
+        )
+    
+    def suggest_optimal_concurrency(self, current_concurrency: int,
+                                    snapshot: Optional[PerformanceSnapshot] = None) -> int:
         """
         Suggest optimal concurrency based on current performance.
         
         Args:
             current_concurrency: Current concurrency level
+            snapshot: Optional pre-captured snapshot (taken fresh if None)
             
         Returns:
             Suggested optimal concurrency level
         """
-        report = self.monitor.generate_performance_report()
-        
-        # Get system resources
-        system_memory = self.monitor.get_system_memory_info()
-        cpu_count = psutil.cpu_count()
+        if snapshot is None:
+            report = self.monitor.generate_performance_report()
+            system_memory = self.monitor.get_system_memory_info()
+        else:
+            report = snapshot.report
+            system_memory = snapshot.system_memory
+        cpu_count = self._cpu_count
         
         # Base suggestion on current performance
         if report.error_rate_percentage > 10:
             # High error rate, reduce concurrency
             suggested = max(1, current_concurrency // 2)
-            self.logger.info(f"High error rate detected, suggesting reduced concurrency: {suggested}")
+            self.logger.info("High error rate detected, suggesting reduced concurrency: %s", suggested)
         elif report.avg_api_response_time > 10:
             # Slow API responses, reduce concurrency
             suggested = max(1, current_concurrency - 2)
-            self.logger.info(f"Slow API responses detected, suggesting reduced concurrency: {suggested}")
+            self.logger.info("Slow API responses detected, suggesting reduced concurrency: %s", suggested)
         elif system_memory and system_memory.get('percentage', 0) > 85:
             # High memory usage, reduce concurrency
             suggested = max(1, current_concurrency - 1)
-            self.logger.info(f"High memory usage detected, suggesting reduced concurrency: {suggested}")
+            self.logger.info("High memory usage detected, suggesting reduced concurrency: %s", suggested)
         elif (report.avg_api_response_time < 2 and 
               report.error_rate_percentage < 2 and
               report.avg_throughput_chunks_per_second > 2):
             # Good performance, can increase concurrency
             max_concurrency = min(cpu_count * 2, 20)  # Cap at reasonable limit
             suggested = min(max_concurrency, current_concurrency + 2)
-            self.logger.info(f"Good performance detected, suggesting increased concurrency: {suggested}")
+            self.logger.info("Good performance detected, suggesting increased concurrency: %s", suggested)
         else:
             # Keep current concurrency
             suggested = current_concurrency
         
         return suggested
     
-    def suggest_optimal_chunk_size(self, current_chunk_size: int) -> int:
+    def suggest_optimal_chunk_size(self, current_chunk_size: int,
+                                   snapshot: Optional[PerformanceSnapshot] = None) -> int:
         """
         Suggest optimal chunk size based on current performance.
         
         Args:
             current_chunk_size: Current chunk size in lines
+            snapshot: Optional pre-captured snapshot (taken fresh if None)
             
         Returns:
             Suggested optimal chunk size
         """
-        report = self.monitor.generate_performance_report()
+        if snapshot is None:
+            report = self.monitor.generate_performance_report()
+        else:
+            report = snapshot.report
         
         if report.peak_memory_usage_mb > 1024:
             # High memory usage, reduce chunk size
             suggested = max(100, current_chunk_size // 2)
-            self.logger.info(f"High memory usage detected, suggesting smaller chunks: {suggested}")
+            self.logger.info("High memory usage detected, suggesting smaller chunks: %s", suggested)
         elif report.avg_chunk_processing_time > 30:
             # Slow processing, reduce chunk size
             suggested = max(100, current_chunk_size - 100)
-            self.logger.info(f"Slow chunk processing detected, suggesting smaller chunks: {suggested}")
+            self.logger.info("Slow chunk processing detected, suggesting smaller chunks: %s", suggested)
         elif (report.avg_chunk_processing_time < 5 and 
               report.peak_memory_usage_mb < 512):
             # Fast processing and low memory, can increase chunk size
             suggested = min(2000, current_chunk_size + 200)
-            self.logger.info(f"Fast processing detected, suggesting larger chunks: {suggested}")
+            self.logger.info("Fast processing detected, suggesting larger chunks: %s", suggested)
         else:
             # Keep current chunk size
             suggested = current_chunk_size
         
         return suggested
     
-    def should_pause_processing(self) -> bool:
+    def should_pause_processing(self, snapshot: Optional[PerformanceSnapshot] = None) -> bool:
         """
         Determine if processing should be paused due to resource constraints.
         
+        Args:
+            snapshot: Optional pre-captured snapshot (taken fresh if None)
+            
         Returns:
             True if processing should be paused
         """
-        system_memory = self.monitor.get_system_memory_info()
+        if snapshot is None:
+            system_memory = self.monitor.get_system_memory_info()
+        else:
+            system_memory = snapshot.system_memory
         
         # Pause if system memory usage is critically high
         if system_memory and system_memory.get('percentage', 0) > 95:
@@ -504,7 +656,10 @@ class PerformanceOptimizer:
             return True
         
         # Pause if current process memory is extremely high
-        current_memory = self.monitor.get_current_memory_usage()
+        if snapshot is None:
+            current_memory = self.monitor.get_current_memory_usage()
+        else:
+            current_memory = snapshot.current_memory_mb
         if current_memory > 2048:  # 2GB
             self.logger.warning("Process memory extremely high, suggesting pause")
             return True
@@ -5,13 +5,20 @@ This module provides Rich-based progress display, detailed logging,
 and user-friendly error reporting functionality.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import re
 import sys
-from typing import Optional, Any, Dict
-from datetime import datetime
+import threading
+import time
+from types import MappingProxyType
+from typing import Optional, Any, Dict, List, Mapping, Tuple
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.progress import (
     Progress, 
     TaskID, 
@@ -31,6 +38,146 @@ from .interfaces import IProgressReporter, ILogger
 from .models import TranslationStats, TranslationProgress
 
 
+# 未显式传入控制台时共享的 Rich 控制台
+_DEFAULT_CONSOLE: Optional[Console] = None
+_DEFAULT_CONSOLE_LOCK = threading.Lock()
+
+
+def _get_default_console() -> Console:
+    """
+    Get the shared default Rich console, creating it on first use.
+    
+    Returns:
+        Process-wide Console instance
+    """
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        with _DEFAULT_CONSOLE_LOCK:
+            if _DEFAULT_CONSOLE is None:
+                _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
+
+
+# 日志文件缓冲区大小（字节）
+DEFAULT_BUFFER_CAPACITY = 64 * 1024
+
+# 缓冲模式下定时刷新日志文件的间隔（秒）
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# 日志文件写入模式
+WRITE_MODES = ('direct', 'buffered', 'buffered_no_flush')
+
+
+# 匹配 Rich 标记的起始，如 [yellow]、[/red]、[#ff0000]
+_MARKUP_RE = re.compile(r'\[[a-z/#]')
+
+
+class _MarkupFilter(logging.Filter):
+    """Enable Rich markup only for records whose message template contains markup."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'markup'):
+            record.markup = isinstance(record.msg, str) and _MARKUP_RE.search(record.msg) is not None
+        return True
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer instead of flushing per record.
+    
+    In the buffered modes the file is opened in binary mode and each record
+    is encoded once, so the text layer's newline translation is skipped.
+    
+    Write modes:
+        direct: behave like logging.FileHandler (flush after every record)
+        buffered: flush every flush_interval seconds and on close
+        buffered_no_flush: flush only when the buffer fills or on close
+    """
+    
+    # A binary file in the buffered modes, not the text stream the base class declares
+    stream: Any
+    
+    def __init__(
+        self,
+        filename: str,
+        mode: str = 'a',
+        encoding: Optional[str] = None,
+        write_mode: str = 'buffered',
+        buffer_size: int = DEFAULT_BUFFER_CAPACITY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Path to log file
+            mode: File open mode
+            encoding: File encoding
+            write_mode: One of WRITE_MODES
+            buffer_size: Size of the file buffer in bytes
+            flush_interval: Seconds between periodic flushes in 'buffered' mode
+        """
+        if write_mode not in WRITE_MODES:
+            raise ValueError(f"Invalid write mode: {write_mode}. Must be one of {WRITE_MODES}")
+        
+        self.write_mode = write_mode
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._byte_encoding = self.encoding or 'utf-8'
+        self._byte_errors = getattr(self, 'errors', None) or 'strict'
+        
+        if write_mode == 'buffered':
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
+    
+    def _open(self) -> Any:
+        """Open the log file in binary mode with the configured buffer size."""
+        if self.write_mode == 'direct':
+            return super()._open()
+        return open(os.fspath(self.baseFilename), self.mode + 'b', buffering=self.buffer_size)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encode the formatted record and write it to the binary stream."""
+        if self.write_mode == 'direct':
+            super().emit(record)
+            return
+        
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self._byte_encoding, self._byte_errors))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self) -> None:
+        """Flush only in direct mode; buffered modes flush on a timer or on close."""
+        if self.write_mode == 'direct':
+            super().flush()
+    
+    def force_flush(self) -> None:
+        """Flush buffered records to disk regardless of write mode."""
+        super().flush()
+    
+    def _flush_loop(self) -> None:
+        """Periodically flush the buffer until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.force_flush()
+    
+    def close(self) -> None:
+        """Stop periodic flushing and close the file (flushing the buffer)."""
+        self._stop_flushing.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        super().close()
+
+
 class RichProgressReporter(IProgressReporter):
     """
     Rich-based progress reporter with beautiful console output.
@@ -39,18 +186,51 @@ class RichProgressReporter(IProgressReporter):
     current status, and visual progress bars.
     """
     
-    def __init__(self, console: Optional[Console] = None):
+    # 进度条每秒最多重绘次数
+    REFRESH_PER_SECOND = 10
+    
+    # 两次进度更新之间的最小间隔（秒），更频繁的更新会被合并
+    MIN_UPDATE_INTERVAL = 0.05
+    
+    # 进度条列定义，与具体任务无关，只构建一次
+    _COLUMNS = (
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("({task.completed}/{task.total})"),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+    )
+    
+    @classmethod
+    def default(cls) -> "RichProgressReporter":
+        """
+        Create a progress reporter that writes to the shared default console.
+        
+        Returns:
+            RichProgressReporter instance
+        """
+        return cls(_get_default_console())
+    
+    def __init__(self, console: Console):
         """
         Initialize the progress reporter.
         
         Args:
-            console: Optional Rich console instance
+            console: Rich console instance
         """
-        self.console = console or Console()
+        self.console = console
         self.progress: Optional[Progress] = None
         self.task_id: Optional[TaskID] = None
         self.live: Optional[Live] = None
-        self._start_time: Optional[datetime] = None
+        self._start_time: Optional[float] = None
+        self._total = 0
+        self._last_update = 0.0
+        self._pending_update: Optional[Tuple[int, str]] = None
+        self._last_description = ""
+        self._flush_timer: Optional[threading.Timer] = None
+        self._update_lock = threading.Lock()
         
     def start_progress(self, total_items: int, description: str = "处理中") -> None:
         """
@@ -60,21 +240,21 @@ class RichProgressReporter(IProgressReporter):
             total_items: Total number of items to process
             description: Description of the operation
         """
-        self._start_time = datetime.now()
+        self._start_time = time.monotonic()
         
         # 创建自定义进度条
         self.progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("({task.completed}/{task.total})"),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
+            *self._COLUMNS,
             console=self.console,
-            expand=True
+            expand=True,
+            refresh_per_second=self.REFRESH_PER_SECOND,
+            auto_refresh=True
         )
         
+        self._total = total_items
+        self._last_update = 0.0
+        self._pending_update = None
+        self._last_description = description
         self.task_id = self.progress.add_task(description, total=total_items)
         self.progress.start()
         
@@ -87,16 +267,54 @@ class RichProgressReporter(IProgressReporter):
             message: Optional status message
         """
         if self.progress and self.task_id is not None:
-            # 更新描述以包含状态消息
-            description = f"处理中"
-            if message:
-                description += f" - {message}"
-            
-            self.progress.update(
-                self.task_id, 
-                completed=completed,
-                description=description
-            )
+            now = time.monotonic()
+            with self._update_lock:
+                elapsed = now - self._last_update
+                if completed < self._total and elapsed < self.MIN_UPDATE_INTERVAL:
+                    # 合并高频更新，由定时器补发最后一次
+                    self._pending_update = (completed, message)
+                    if self._flush_timer is None:
+                        self._flush_timer = threading.Timer(
+                            self.MIN_UPDATE_INTERVAL - elapsed, self._flush_pending_update
+                        )
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                    return
+                
+                self._pending_update = None
+                self._last_update = now
+                self._apply_update(completed, message)
+    
+    def _apply_update(self, completed: int, message: str) -> None:
+        """Push a progress update to the Rich progress bar."""
+        if self.progress is None or self.task_id is None:
+            return
+        
+        # 更新描述以包含状态消息
+        description = f"处理中 - {message}" if message else "处理中"
+        
+        if description == self._last_description:
+            # 描述未变化时只更新完成数
+            self.progress.update(self.task_id, completed=completed)
+            return
+        
+        self.progress.update(
+            self.task_id, 
+            completed=completed,
+            description=description
+        )
+        self._last_description = description
+    
+    def _flush_pending_update(self) -> None:
+        """Apply the most recent coalesced update, if any."""
+        with self._update_lock:
+            self._flush_timer = None
+            if self._pending_update is None or not self.progress or self.task_id is None:
+                return
+            completed, message = self._pending_update
+            self._pending_update = None
+            self._last_update = time.monotonic()
+            self._apply_update(completed, message)
     
     def finish_progress(self, success: bool = True, message: str = "") -> None:
         """
@@ -107,6 +325,12 @@ class RichProgressReporter(IProgressReporter):
             message: Final status message
         """
         if self.progress:
+            # 取消定时器并立即应用被合并的最后一次更新
+            timer = self._flush_timer
+            if timer is not None:
+                timer.cancel()
+            self._flush_pending_update()
+            
             if success:
                 final_message = f"✅ 完成"
                 if message:
@@ -122,9 +346,9 @@ class RichProgressReporter(IProgressReporter):
             self.progress.stop()
             
             # 显示完成时间
-            if self._start_time:
-                elapsed = datetime.now() - self._start_time
-                self.console.print(f"总耗时: {elapsed.total_seconds():.2f} 秒")
+            if self._start_time is not None:
+                elapsed_s = time.monotonic() - self._start_time
+                self.console.print(f"总耗时: {elapsed_s:.2f} 秒")
     
     def display_statistics(self, stats: TranslationStats) -> None:
         """
@@ -139,15 +363,19 @@ class RichProgressReporter(IProgressReporter):
         table.add_column("数值", style="green")
         
         # 添加统计数据
-        table.add_row("总片段数", str(stats.total_chunks))
-        table.add_row("成功翻译", str(stats.successful_translations))
-        table.add_row("失败翻译", str(stats.failed_translations))
-        table.add_row("成功率", f"{stats.success_rate:.1f}%")
-        table.add_row("总行数", str(stats.total_lines))
-        table.add_row("总耗时", f"{stats.total_processing_time:.2f} 秒")
-        table.add_row("平均每片段", f"{stats.average_chunk_time:.2f} 秒")
-        table.add_row("重试次数", str(stats.total_retries))
-        table.add_row("API调用", str(stats.api_calls_made))
+        rows = (
+            ("总片段数", str(stats.total_chunks)),
+            ("成功翻译", str(stats.successful_translations)),
+            ("失败翻译", str(stats.failed_translations)),
+            ("成功率", f"{stats.success_rate:.1f}%"),
+            ("总行数", str(stats.total_lines)),
+            ("总耗时", f"{stats.total_processing_time:.2f} 秒"),
+            ("平均每片段", f"{stats.average_chunk_time:.2f} 秒"),
+            ("重试次数", str(stats.total_retries)),
+            ("API调用", str(stats.api_calls_made)),
+        )
+        for label, value in rows:
+            table.add_row(label, value)
         
         self.console.print(table)
     
@@ -161,8 +389,9 @@ class RichProgressReporter(IProgressReporter):
         if not errors:
             return
             
+        # 逐行交给 Rich 渲染，不拼接中间大字符串
         error_panel = Panel(
-            "\n".join(f"• {error}" for error in errors),
+            Group(*(Text(f"• {error}") for error in errors)),
             title="❌ 错误摘要",
             title_align="left",
             border_style="red"
@@ -178,12 +407,16 @@ class TranslationLogger(ILogger):
     and beautiful console formatting using Rich.
     """
     
+    # 已配置的日志器名称 -> (日志文件, 控制台, 持有处理器的实例)
+    _configured: Dict[str, Tuple[Optional[str], Console, 'TranslationLogger']] = {}
+    
     def __init__(
         self, 
         name: str = "markdown_translator",
         level: int = logging.INFO,
         log_file: Optional[str] = None,
-        console: Optional[Console] = None
+        console: Optional[Console] = None,
+        write_mode: str = 'buffered'
     ):
         """
         Initialize the logger.
@@ -193,22 +426,43 @@ class TranslationLogger(ILogger):
             level: Logging level
             log_file: Optional file path for log output
             console: Optional Rich console instance
+            write_mode: Log file write mode ('direct', 'buffered', 'buffered_no_flush')
         """
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
-        self.console = console or Console()
+        self.console = console or _get_default_console()
+        self._file_handler: Optional[logging.Handler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._handlers: List[logging.Handler] = []
+        self._owner: TranslationLogger = self
+        
+        # 同名日志器已按相同目标配置过时，复用其处理器，只调整级别
+        previous = TranslationLogger._configured.get(name)
+        if (previous is not None and previous[0] == log_file and
+                previous[1] is self.console and previous[2]._handlers):
+            self._owner = previous[2]
+            self.set_level(level)
+            return
+        
+        # 释放旧处理器（立即关闭文件句柄），避免处理器链重复
+        if previous is not None:
+            previous[2].close()
+        for handler in self.logger.handlers[:]:
+            handler.close()
+            self.logger.removeHandler(handler)
         
-        # 清除现有的处理器
-        self.logger.handlers.clear()
+        self.logger.setLevel(level)
+        self._refresh_enabled_levels()
         
         # 添加Rich控制台处理器
+        # 默认不解析标记，仅对含标记的消息开启，纯文本消息跳过 Rich 标记解析
         console_handler = RichHandler(
             console=self.console,
             show_time=True,
             show_path=False,
-            markup=True
+            markup=False
         )
         console_handler.setLevel(level)
+        console_handler.addFilter(_MarkupFilter())
         
         # 设置控制台格式
         console_format = logging.Formatter(
@@ -217,26 +471,29 @@ class TranslationLogger(ILogger):
         )
         console_handler.setFormatter(console_format)
         self.logger.addHandler(console_handler)
+        self._handlers.append(console_handler)
         
         # 添加文件处理器（如果指定了日志文件）
         if log_file:
-            self._setup_file_handler(log_file, level)
+            self._setup_file_handler(log_file, level, write_mode)
+        
+        TranslationLogger._configured[name] = (log_file, self.console, self)
     
-    def _setup_file_handler(self, log_file: str, level: int) -> None:
+    def _setup_file_handler(self, log_file: str, level: int, write_mode: str = 'buffered') -> None:
         """
         Setup file handler for logging to file.
         
         Args:
             log_file: Path to log file
             level: Logging level
+            write_mode: Log file write mode
         """
         try:
             # 确保日志目录存在
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(level)
+            file_handler = BufferedFileHandler(log_file, encoding='utf-8', write_mode=write_mode)
             
             # 设置文件格式（更详细）
             file_format = logging.Formatter(
@@ -244,30 +501,54 @@ class TranslationLogger(ILogger):
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_format)
-            self.logger.addHandler(file_handler)
+            
+            # 文件写入由后台监听线程完成，日志调用只需入队
+            # 级别过滤在入队时由 QueueHandler 完成
+            log_queue: queue.Queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            self._listener = logging.handlers.QueueListener(log_queue, file_handler)
+            self._listener.start()
+            self._file_handler = file_handler
+            self.logger.addHandler(queue_handler)
+            self._handlers.append(queue_handler)
+            # 进程退出时确保队列中的日志写入文件
+            atexit.register(self.close)
             
         except Exception as e:
             self.console.print(f"[yellow]警告: 无法设置文件日志 {log_file}: {e}[/yellow]")
     
+    def _refresh_enabled_levels(self) -> None:
+        """Cache which levels are enabled so suppressed calls return immediately."""
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
+        self._warning_enabled = self.logger.isEnabledFor(logging.WARNING)
+        self._error_enabled = self.logger.isEnabledFor(logging.ERROR)
+    
     def info(self, message: str, **kwargs) -> None:
         """Log an info message."""
-        self.logger.info(message, **kwargs)
+        if self._info_enabled:
+            self.logger.info(message, **kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log a warning message."""
-        self.logger.warning(f"[yellow]{message}[/yellow]", **kwargs)
+        if self._warning_enabled:
+            self.logger.warning("[yellow]%s[/yellow]", message, **kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """Log an error message."""
-        self.logger.error(f"[red]{message}[/red]", **kwargs)
+        if self._error_enabled:
+            self.logger.error("[red]%s[/red]", message, **kwargs)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log a debug message."""
-        self.logger.debug(f"[dim]{message}[/dim]", **kwargs)
+        if self._debug_enabled:
+            self.logger.debug("[dim]%s[/dim]", message, **kwargs)
     
     def success(self, message: str, **kwargs) -> None:
         """Log a success message."""
-        self.logger.info(f"[green]✅ {message}[/green]", **kwargs)
+        if self._info_enabled:
+            self.logger.info("[green]✅ %s[/green]", message, **kwargs)
     
     def set_level(self, level: int) -> None:
         """
@@ -279,6 +560,113 @@ class TranslationLogger(ILogger):
         self.logger.setLevel(level)
         for handler in self.logger.handlers:
             handler.setLevel(level)
+        self._refresh_enabled_levels()
+    
+    def close(self) -> None:
+        """
+        Flush pending file log records and release handlers.
+        """
+        if self._owner is not self:
+            # 处理器属于先前配置同名日志器的实例
+            self._owner.close()
+            return
+        
+        configured = TranslationLogger._configured.get(self.logger.name)
+        if configured is not None and configured[2] is self:
+            del TranslationLogger._configured[self.logger.name]
+        
+        if self._listener is not None:
+            # stop() 会先处理完队列中剩余的记录
+            self._listener.stop()
+            self._listener = None
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+        for handler in self._handlers:
+            handler.close()
+            self.logger.removeHandler(handler)
+        self._handlers.clear()
+
+
+# 错误类型 -> (标题, 消息, 解决方案)
+_ERROR_MESSAGES: Mapping[str, Tuple[str, str, str]] = MappingProxyType({
+    'api_key_missing': (
+        '🔑 API密钥缺失',
+        'OpenRouter API密钥未设置',
+        '请设置环境变量 TRANSLATE_API_TOKEN'
+    ),
+    'api_connection_failed': (
+        '🌐 API连接失败',
+        '无法连接到OpenRouter API',
+        '请检查网络连接和API密钥是否正确'
+    ),
+    'file_not_found': (
+        '📁 文件未找到',
+        '指定的输入文件不存在',
+        '请检查文件路径是否正确'
+    ),
+    'permission_denied': (
+        '🚫 权限不足',
+        '没有权限访问指定文件或目录',
+        '请检查文件权限或使用管理员权限运行'
+    ),
+    'disk_space_full': (
+        '💾 磁盘空间不足',
+        '磁盘空间不足，无法写入文件',
+        '请清理磁盘空间或选择其他输出位置'
+    ),
+    'rate_limit_exceeded': (
+        '⏱️ API限流',
+        'API调用频率超过限制',
+        '请降低并发度或稍后重试'
+    ),
+})
+
+# 未知错误类型的默认消息
+_DEFAULT_ERROR: Tuple[str, str, str] = (
+    '❌ 未知错误',
+    '发生了未知错误',
+    '请查看详细日志或联系支持'
+)
+
+
+
+def _build_error_template(message: str, solution: str) -> str:
+    """
+    Pre-render the fixed parts of an error panel body.
+    
+    Args:
+        message: Error message shown in bold red
+        solution: Suggested solution text
+        
+    Returns:
+        Format string with {details_block} and {exception_block} slots
+    """
+    message = message.replace('{', '{{').replace('}', '}}')
+    solution = solution.replace('{', '{{').replace('}', '}}')
+    return (
+        f"[bold red]{message}[/bold red]{{details_block}}{{exception_block}}"
+        f"\n\n[bold green]建议解决方案:[/bold green]\n{solution}"
+    )
+
+
+# 错误类型 -> (标题, 面板内容模板)，导入时构建一次
+_ERROR_TEMPLATES: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    error_type: (title, _build_error_template(message, solution))
+    for error_type, (title, message, solution) in _ERROR_MESSAGES.items()
+})
+
+_DEFAULT_ERROR_TEMPLATE: Tuple[str, str] = (
+    _DEFAULT_ERROR[0],
+    _build_error_template(_DEFAULT_ERROR[1], _DEFAULT_ERROR[2])
+)
+
+# 错误面板的固定样式参数
+_ERROR_PANEL_KWARGS: Mapping[str, Any] = MappingProxyType({
+    'title_align': "left",
+    'border_style': "red",
+    'padding': (1, 2),
+})
 
 
 class UserFriendlyErrorReporter:
@@ -289,48 +677,30 @@ class UserFriendlyErrorReporter:
     for common issues.
     """
     
-    def __init__(self, console: Optional[Console] = None):
+    # 验证问题不超过此数量时直接逐行输出，不绘制面板
+    INLINE_VALIDATION_ERROR_LIMIT = 2
+    
+    @classmethod
+    def default(cls) -> "UserFriendlyErrorReporter":
+        """
+        Create a error reporter that writes to the shared default console.
+        
+        Returns:
+            UserFriendlyErrorReporter instance
+        """
+        return cls(_get_default_console())
+    
+    def __init__(self, console: Console):
         """
         Initialize the error reporter.
         
         Args:
-            console: Optional Rich console instance
+            console: Rich console instance
         """
-        self.console = console or Console()
-        
-        # 错误类型到用户友好消息的映射
-        self.error_messages = {
-            'api_key_missing': {
-                'title': '🔑 API密钥缺失',
-                'message': 'OpenRouter API密钥未设置',
-                'solution': '请设置环境变量 TRANSLATE_API_TOKEN'
-            },
-            'api_connection_failed': {
-                'title': '🌐 API连接失败',
-                'message': '无法连接到OpenRouter API',
-                'solution': '请检查网络连接和API密钥是否正确'
-            },
-            'file_not_found': {
-                'title': '📁 文件未找到',
-                'message': '指定的输入文件不存在',
-                'solution': '请检查文件路径是否正确'
-            },
-            'permission_denied': {
-                'title': '🚫 权限不足',
-                'message': '没有权限访问指定文件或目录',
-                'solution': '请检查文件权限或使用管理员权限运行'
-            },
-            'disk_space_full': {
-                'title': '💾 磁盘空间不足',
-                'message': '磁盘空间不足，无法写入文件',
-                'solution': '请清理磁盘空间或选择其他输出位置'
-            },
-            'rate_limit_exceeded': {
-                'title': '⏱️ API限流',
-                'message': 'API调用频率超过限制',
-                'solution': '请降低并发度或稍后重试'
-            }
-        }
+        self.console = console
+        
+        # 错误类型到用户友好消息的映射（模块级只读表）
+        self.error_messages = _ERROR_MESSAGES
     
     def report_error(
         self, 
@@ -346,31 +716,16 @@ class UserFriendlyErrorReporter:
             details: Additional error details
             exception: Optional exception object
         """
-        error_info = self.error_messages.get(error_type, {
-            'title': '❌ 未知错误',
-            'message': '发生了未知错误',
-            'solution': '请查看详细日志或联系支持'
-        })
-        
-        # 构建错误消息
-        content = f"[bold red]{error_info['message']}[/bold red]"
-        
-        if details:
-            content += f"\n\n详细信息: {details}"
+        title, template = _ERROR_TEMPLATES.get(error_type, _DEFAULT_ERROR_TEMPLATE)
         
-        if exception:
-            content += f"\n\n技术详情: {str(exception)}"
-        
-        content += f"\n\n[bold green]建议解决方案:[/bold green]\n{error_info['solution']}"
+        # 在预构建的模板中填入本次调用的详细信息
+        content = template.format_map({
+            'details_block': f"\n\n详细信息: {details}" if details else "",
+            'exception_block': f"\n\n技术详情: {exception!s}" if exception else "",
+        })
         
         # 显示错误面板
-        error_panel = Panel(
-            content,
-            title=error_info['title'],
-            title_align="left",
-            border_style="red",
-            padding=(1, 2)
-        )
+        error_panel = Panel(content, title=title, **_ERROR_PANEL_KWARGS)
         
         self.console.print(error_panel)
     
@@ -384,11 +739,16 @@ class UserFriendlyErrorReporter:
         if not validation_errors:
             return
         
-        content = "发现以下验证问题:\n\n"
+        if len(validation_errors) <= self.INLINE_VALIDATION_ERROR_LIMIT:
+            for error in validation_errors:
+                self.console.print(Text(f"⚠️ {error}", style="yellow"))
+            return
+        
+        content = Text("发现以下验证问题:\n\n")
         for i, error in enumerate(validation_errors, 1):
-            content += f"{i}. {error}\n"
+            content.append(f"{i}. {error}\n")
         
-        content += "\n[bold yellow]这些问题可能影响翻译质量，建议检查输入文件。[/bold yellow]"
+        content.append("\n这些问题可能影响翻译质量，建议检查输入文件。", style="bold yellow")
         
         panel = Panel(
             content,
@@ -6,13 +6,70 @@ while preserving Markdown syntax integrity. The splitter is aware of code blocks
 tables, lists, and other Markdown structures to ensure clean splits.
 """
 
+import hashlib
+import io
 import os
-import uuid
-from typing import List, Optional
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from typing import Dict, Iterator, List, Optional, Tuple
 from .interfaces import ISplitter
 from .models import FileChunk
 
 
+# (start index, end index, content) of each chunk of a file
+_Spans = Tuple[Tuple[int, int, str], ...]
+
+# Line kinds reported by MarkdownSplitter._classify_line, as bit flags since
+# a line can be more than one kind (e.g. "- - -" is both a list item and a rule)
+LINE_HEADER = 1
+LINE_BLOCKQUOTE = 2
+LINE_LIST_ITEM = 4
+LINE_HR = 8
+LINE_HTML_COMMENT = 16
+
+# Markdown elements that never continue a paragraph
+_PARAGRAPH_BREAKERS = LINE_HEADER | LINE_BLOCKQUOTE | LINE_LIST_ITEM | LINE_HR
+
+# Classifies a stripped line by its prefix in one match. Alternatives are tried
+# in order, so a whole-line horizontal rule wins over a bullet marker.
+_LINE_PATTERN = (
+    r'(?P<hr>(?:-(?: *-){2,}|\*(?: *\*){2,}|_(?: *_){2,})$)'
+    r'|(?P<header>#)'
+    r'|(?P<quote>>)'
+    r'|(?P<bullet>[-*+] )'
+    r'|(?P<comment><!--)'
+    r'|(?P<ordered>[^ \n]+)\. '
+)
+_LINE_CLASSIFIER = re.compile(_LINE_PATTERN)
+
+# The same classifier anchored at every line of newline-joined stripped lines,
+# so a whole file is classified in one scan
+_LINE_SCANNER = re.compile(rf'^(?:{_LINE_PATTERN})', re.MULTILINE)
+
+# Fenced code block markers: ``` or ~~~ after optional leading whitespace.
+# [^\S\n] is the whitespace str.strip() removes, without crossing lines.
+_FENCE_RE = re.compile(r'^[^\S\n]*(```|~~~)', re.MULTILINE)
+
+# Deletes the characters allowed in a table separator cell
+_SEPARATOR_CHARS = str.maketrans('', '', '-:')
+
+# Deletes pipes, spaces and tabs, leaving the cell content of a table row
+_TABLE_ROW_TRIM = str.maketrans('', '', '| \t')
+
+_KIND_BY_GROUP = {
+    'hr': LINE_HR,
+    'header': LINE_HEADER,
+    'quote': LINE_BLOCKQUOTE,
+    'bullet': LINE_LIST_ITEM,
+    'ordered': LINE_LIST_ITEM,
+    'comment': LINE_HTML_COMMENT,
+}
+
+
 class MarkdownSplitter(ISplitter):
     """
     Intelligent Markdown file splitter that preserves syntax integrity.
@@ -21,6 +78,15 @@ class MarkdownSplitter(ISplitter):
     break syntax structures like code blocks, tables, or lists.
     """
     
+    # Allowed range for the target number of lines per chunk
+    MIN_CHUNK_SIZE = 10
+    MAX_CHUNK_SIZE = 10000
+    
+    # Number of split results kept for files that have not changed, and the
+    # total size of the files they were computed from
+    SPLIT_CACHE_SIZE = 128
+    SPLIT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    
     def __init__(self, chunk_size: int = 500):
         """
         Initialize the splitter with a target chunk size.
@@ -30,13 +96,17 @@ class MarkdownSplitter(ISplitter):
         """
         self.chunk_size = chunk_size
         self._validate_chunk_size()
+        self._span_cache: 'OrderedDict[Tuple[str, bytes, int], Tuple[int, _Spans]]' = OrderedDict()
+        self._span_cache_bytes = 0
+        self._cache_lock = threading.Lock()
     
     def _validate_chunk_size(self) -> None:
         """Validate that chunk size is reasonable."""
-        if self.chunk_size < 10:
-            raise ValueError("Chunk size must be at least 10 lines")
-        if self.chunk_size > 10000:
-            raise ValueError("Chunk size should not exceed 10000 lines for performance reasons")
+        if self.MIN_CHUNK_SIZE <= self.chunk_size <= self.MAX_CHUNK_SIZE:
+            return
+        if self.chunk_size < self.MIN_CHUNK_SIZE:
+            raise ValueError(f"Chunk size must be at least {self.MIN_CHUNK_SIZE} lines")
+        raise ValueError(f"Chunk size should not exceed {self.MAX_CHUNK_SIZE} lines for performance reasons")
     
     def get_chunk_size(self) -> int:
         """Get the configured chunk size."""
@@ -61,62 +131,408 @@ class MarkdownSplitter(ISplitter):
             FileNotFoundError: If the input file doesn't exist
             IOError: If there's an error reading the file
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Input file not found: {file_path}")
+        return list(self.iter_chunks(file_path))
+    
+    def iter_chunks(self, file_path: str) -> Iterator[FileChunk]:
+        """
+        Split a Markdown file into chunks, yielding them one at a time.
         
+        Chunk objects are created lazily, so a caller that processes and
+        discards each chunk never holds all of them at once.
+        
+        Args:
+            file_path: Path to the Markdown file to split
+            
+        Yields:
+            FileChunk objects in sequence order
+            
+        Raises:
+            FileNotFoundError: If the input file doesn't exist
+            IOError: If there's an error reading the file
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            with open(file_path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {file_path}")
         except IOError as e:
             raise IOError(f"Error reading file {file_path}: {e}")
         
-        if not lines:
-            return []
+        # Unchanged content reuses the spans computed last time; only the chunk
+        # objects and their random IDs are created fresh
+        spans = self._cached_spans(file_path, data)
         
-        chunks = []
-        current_start = 0
+        # Random ID suffixes for all chunks from a single urandom call
+        id_suffixes = os.urandom(4 * len(spans)).hex()
         
-        while current_start < len(lines):
-            # Calculate the target end line for this chunk
-            target_end = min(current_start + self.chunk_size, len(lines))
-            
-            # Find a safe split point near the target
-            actual_end = self._find_safe_split_point(lines, current_start, target_end)
-            
+        for chunk_index, (start, end, chunk_content) in enumerate(spans):
             # Create the chunk with sequential ID and sequence number
-            chunk_content = ''.join(lines[current_start:actual_end])
-            chunk_index = len(chunks)  # 0-based index
-            chunk_id = f"chunk_{chunk_index:03d}_{str(uuid.uuid4())[:8]}"  # e.g., "chunk_000_a1b2c3d4"
+            suffix = id_suffixes[8 * chunk_index:8 * chunk_index + 8]
+            chunk_id = f"chunk_{chunk_index:03d}_{suffix}"  # e.g., "chunk_000_a1b2c3d4"
             
             chunk = FileChunk(
                 id=chunk_id,
                 content=chunk_content,
-                start_line=current_start + 1,  # 1-based line numbering
-                end_line=actual_end,           # 1-based line numbering
+                start_line=start + 1,  # 1-based line numbering
+                end_line=end,          # 1-based line numbering
                 original_file=file_path,
                 sequence_number=chunk_index
             )
             
-            chunks.append(chunk)
+            yield chunk
+    
+    def split_files(self, file_paths: List[str], workers: Optional[int] = None) -> Dict[str, List[FileChunk]]:
+        """
+        Split several Markdown files, in parallel worker processes.
+        
+        Line classification is CPU-bound Python code, so separate processes
+        let independent files be split concurrently without contending for
+        the GIL.
+        
+        Args:
+            file_paths: Paths to the Markdown files to split
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            Dictionary mapping each file path to its list of chunks
+            
+        Raises:
+            FileNotFoundError: If an input file doesn't exist
+            IOError: If there's an error reading a file
+        """
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        if workers <= 1:
+            return {file_path: self.split_file(file_path) for file_path in file_paths}
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_split_file_in_worker, file_paths, repeat(self.chunk_size),
+                                   chunksize=max(1, len(file_paths) // (4 * workers)))
+            return dict(zip(file_paths, results))
+    
+    def _cached_spans(self, file_path: str, data: bytes) -> _Spans:
+        """
+        Look up the chunk boundaries of a file's content, computing them on a miss.
+        
+        Results are keyed by absolute path and a digest of the content, and
+        are evicted oldest first once either cache limit is exceeded.
+        
+        Args:
+            file_path: Path to the Markdown file being split
+            data: Raw content of the file
+            
+        Returns:
+            Tuple of (start index, end index, content) for each chunk
+        """
+        chunk_size = self.chunk_size
+        key = (
+            os.path.abspath(file_path),
+            hashlib.blake2b(data, digest_size=16).digest(),
+            chunk_size,
+        )
+        with self._cache_lock:
+            entry = self._span_cache.get(key)
+            if entry is not None:
+                self._span_cache.move_to_end(key)
+                return entry[1]
+        
+        spans = self._compute_spans(data, chunk_size)
+        
+        # A file larger than the whole budget is not worth evicting everything for
+        size = len(data)
+        if size > self.SPLIT_CACHE_MAX_BYTES:
+            return spans
+        
+        with self._cache_lock:
+            previous = self._span_cache.pop(key, None)
+            if previous is not None:
+                self._span_cache_bytes -= previous[0]
+            self._span_cache[key] = (size, spans)
+            self._span_cache_bytes += size
+            while (len(self._span_cache) > self.SPLIT_CACHE_SIZE or
+                   self._span_cache_bytes > self.SPLIT_CACHE_MAX_BYTES):
+                evicted_size, _ = self._span_cache.popitem(last=False)[1]
+                self._span_cache_bytes -= evicted_size
+        
+        return spans
+    
+    def _compute_spans(self, data: bytes, chunk_size: int) -> _Spans:
+        """
+        Compute the chunk boundaries of a file's content.
+        
+        Args:
+            data: Raw content of the Markdown file
+            chunk_size: Target number of lines per chunk
+            
+        Returns:
+            Tuple of (start index, end index, content) for each chunk
+        """
+        # Apply the same newline translation as reading the file in text mode,
+        # then split the whole buffer in one C-level pass
+        text = data.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = io.StringIO(text).readlines()
+        
+        if not lines:
+            return ()
+        
+        # A file that fits in one chunk needs no split points
+        if len(lines) <= chunk_size:
+            return ((0, len(lines), text),)
+        
+        # Strip and measure every line once; all predicates share these arrays
+        stripped = [line.strip() for line in lines]
+        indents = array('i', [self._get_line_indent(line) for line in lines])
+        
+        # Classify every line once up front; split-point checks become lookups
+        classes = self._classify(text, lines, stripped, indents)
+        
+        # Start offset of each line in the text, so chunk content is one slice
+        # of the text rather than a join over a list slice of lines. A typed
+        # array keeps the table at 8 bytes per line instead of an int object each.
+        offsets = array('q', accumulate(map(len, lines), initial=0))
+        
+        spans = []
+        current_start = 0
+        
+        while current_start < len(lines):
+            # Calculate the target end line for this chunk
+            target_end = min(current_start + chunk_size, len(lines))
+            
+            # Find a safe split point near the target
+            actual_end = self._find_safe_split_point(stripped, current_start, target_end, classes)
+            
+            spans.append((current_start, actual_end, text[offsets[current_start]:offsets[actual_end]]))
             current_start = actual_end
         
-        return chunks
+        return tuple(spans)
     
-    def _find_safe_split_point(self, lines: List[str], start: int, target_end: int) -> int:
+    def _classify(self, text: str, lines: List[str], stripped: List[str], indents: array) -> Dict[str, bytearray]:
         """
-        Find a safe point to split the content that doesn't break Markdown syntax.
+        Classify every line of the file in a single pass.
+        
+        Each entry maps a structural property to a per-line flag array, so
+        checking a candidate split point no longer rescans the file.
         
         Args:
+            text: Full file content the lines were split from
             lines: List of all lines in the file
+            stripped: The same lines with surrounding whitespace removed
+            indents: Indentation width of each line
+            
+        Returns:
+            Dictionary of per-line flags: in_code, in_table, in_list,
+            in_blockquote, in_link_reference, is_header,
+            is_setext_underline, is_hr and is_blank, plus the LINE_* bit
+            flags of each line under 'kind'
+        """
+        n = len(lines)
+        kinds = self._classify_lines(stripped)
+        in_code = bytearray(n)
+        in_table = bytearray(n)
+        in_list = bytearray(n)
+        in_blockquote = bytearray(n)
+        is_header = bytearray(n)
+        is_setext_underline = bytearray(n)
+        is_hr = bytearray(n)
+        is_blank = bytearray(n)
+        
+        # Only lines containing a pipe can be table lines, so the table
+        # predicates run on those alone. Running counts of separator and row
+        # lines make the window check around each line a subtraction.
+        pipe_lines = [i for i, line in enumerate(stripped) if '|' in line]
+        is_separator = bytearray(n + 1)
+        is_row = bytearray(n + 1)
+        for i in pipe_lines:
+            line = stripped[i]
+            if self._is_table_separator_line(line):
+                is_separator[i + 1] = 1
+            elif self._is_table_row_line(line):
+                is_row[i + 1] = 1
+        separator_counts = list(accumulate(is_separator))
+        row_counts = list(accumulate(is_row))
+        
+        # A table needs a separator and at least 2 table rows within 5 lines
+        for i in pipe_lines:
+            window_start = max(0, i - 5)
+            window_end = min(n, i + 6)
+            in_table[i] = (separator_counts[window_end] > separator_counts[window_start] and
+                           row_counts[window_end] - row_counts[window_start] >= 2)
+        
+        # Link reference definitions are rare, so mark the 2-line window
+        # around each one instead of scanning a window for every line
+        in_link_reference = bytearray(n)
+        for i, line in enumerate(stripped):
+            if line[:1] == '[' and ']:' in line:
+                window_start = max(0, i - 2)
+                window_end = min(n, i + 3)
+                in_link_reference[window_start:window_end] = b'\x01' * (window_end - window_start)
+        
+        in_fence = self._fence_mask(text, n)
+        # Blockquote state carried along the walk: the last non-empty line and
+        # whether it was a quote line, instead of rescanning up to 4 lines back
+        last_text_index = -5
+        last_text_quoted = False
+        # List state likewise: the last list item line and the smallest indent
+        # of the non-empty lines since, which replaces the 9-line backward scan
+        last_item_index = -10
+        min_indent_since_item = float('inf')
+        for i, line in enumerate(stripped):
+            in_code[i] = in_fence[i] or (
+                line != '' and lines[i].startswith(('    ', '\t')) and self._is_indented_code_block(lines, stripped, i)
+            )
+            
+            # A line continues the nearest list item within 9 lines when no
+            # shallower text line sits between them and it is indented further
+            # (or is itself a list item at the same level)
+            indent = indents[i]
+            if i - last_item_index <= 9 and min_indent_since_item >= indent:
+                item_indent = indents[last_item_index]
+                in_list[i] = indent > item_indent or (indent == item_indent and kinds[i] & LINE_LIST_ITEM != 0)
+            if line:
+                if kinds[i] & LINE_LIST_ITEM:
+                    last_item_index = i
+                    min_indent_since_item = float('inf')
+                elif indent < min_indent_since_item:
+                    min_indent_since_item = indent
+                
+
+                quoted = line.startswith('>')
+                in_blockquote[i] = quoted or (
+                    last_text_quoted and i - last_text_index <= 4 and not line.startswith('#')
+                )
+                last_text_index = i
+                last_text_quoted = quoted
+            is_header[i] = kinds[i] & LINE_HEADER != 0
+            is_setext_underline[i] = line[:1] in ('=', '-') and self._is_setext_header_underline(stripped, i)
+            is_hr[i] = kinds[i] & LINE_HR != 0
+            is_blank[i] = not line
+        
+        return {
+            'in_code': in_code,
+            'in_table': in_table,
+            'in_list': in_list,
+            'in_blockquote': in_blockquote,
+            'in_link_reference': in_link_reference,
+            'is_header': is_header,
+            'is_setext_underline': is_setext_underline,
+            'is_hr': is_hr,
+            'is_blank': is_blank,
+            'kind': kinds,
+        }
+    
+    def _fence_mask(self, text: str, line_count: int) -> bytearray:
+        """
+        Flag the lines that lie inside a fenced code block.
+        
+        Fence markers are found with a single regex scan over the whole text
+        rather than by checking every line in Python. A line is flagged when
+        the markers before it leave a ``` or ~~~ block open.
+        
+        Args:
+            text: Full file content, with newlines already translated to \\n
+            line_count: Number of lines in the text
+            
+        Returns:
+            Per-line flags, 1 for lines inside a fenced code block
+        """
+        in_fence = bytearray(line_count)
+        in_backtick_block = False
+        in_tilde_block = False
+        fill_from = 0
+        line_index = 0
+        last_offset = 0
+        
+        for match in _FENCE_RE.finditer(text):
+            line_index += text.count('\n', last_offset, match.start())
+            last_offset = match.start()
+            
+            # Lines up to and including the marker keep the state before it
+            if in_backtick_block or in_tilde_block:
+                in_fence[fill_from:line_index + 1] = b'\x01' * (line_index + 1 - fill_from)
+            if match.group(1) == '```':
+                in_backtick_block = not in_backtick_block
+            else:
+                in_tilde_block = not in_tilde_block
+            fill_from = line_index + 1
+        
+        if in_backtick_block or in_tilde_block:
+            in_fence[fill_from:] = b'\x01' * (line_count - fill_from)
+        
+        return in_fence
+    
+    def _classify_lines(self, stripped: List[str]) -> bytearray:
+        """
+        Classify every stripped line into LINE_* bit flags in one regex scan.
+        
+        Only lines the scanner matches are visited in Python; plain text lines
+        keep the default of 0.
+        
+        Args:
+            stripped: List of all lines in the file, stripped
+            
+        Returns:
+            LINE_* flags of each line, as from _classify_line
+        """
+        kinds = bytearray(len(stripped))
+        joined = '\n'.join(stripped)
+        line_index = 0
+        last_offset = 0
+        
+        for match in _LINE_SCANNER.finditer(joined):
+            line_index += joined.count('\n', last_offset, match.start())
+            last_offset = match.start()
+            
+            group = match.lastgroup
+            if group is None:
+                continue
+            if group == 'hr':
+                line = stripped[line_index]
+                kinds[line_index] = LINE_HR | LINE_LIST_ITEM if line[1] == ' ' and line[0] != '_' else LINE_HR
+            elif group != 'ordered' or match.group('ordered').isdigit():
+                kinds[line_index] = _KIND_BY_GROUP[group]
+        
+        return kinds
+    
+    def _classify_line(self, line: str) -> int:
+        """
+        Classify a stripped line into LINE_* bit flags.
+        
+        Args:
+            line: Stripped line to classify
+            
+        Returns:
+            Combination of LINE_* flags, 0 for regular text
+        """
+        match = _LINE_CLASSIFIER.match(line)
+        group = match.lastgroup if match is not None else None
+        if match is None or group is None:
+            return 0
+        
+        if group == 'hr':
+            # "- - -" and "* * *" also start with a bullet marker
+            return LINE_HR | LINE_LIST_ITEM if line[1] == ' ' and line[0] != '_' else LINE_HR
+        if group == 'ordered' and not match.group('ordered').isdigit():
+            return 0
+        return _KIND_BY_GROUP[group]
+    
+    def _find_safe_split_point(self, stripped: List[str], start: int, target_end: int,
+                               classes: Dict[str, bytearray]) -> int:
+        """
+        Find a safe point to split the content that doesn't break Markdown syntax.
+        
+        Args:
+            stripped: List of all lines in the file, stripped
             start: Starting line index for this chunk
             target_end: Target ending line index
+            classes: Per-line flags from _classify
             
         Returns:
             Actual ending line index that's safe for splitting
         """
         # If we're at the end of the file, return the target
-        if target_end >= len(lines):
-            return len(lines)
+        if target_end >= len(stripped):
+            return len(stripped)
         
         # If the chunk would be very small, just use the target
         if target_end - start < 10:
@@ -127,13 +543,14 @@ class MarkdownSplitter(ISplitter):
         
         # Start from the target and work backwards to find a safe point
         for i in range(target_end, max(start + 10, target_end - search_range), -1):
-            if self._is_safe_split_point(lines, i):
+            if self._is_safe_split_point(stripped, i, classes):
                 return i
         
         # If no safe point found, use the target (basic fallback)
         return target_end
     
-    def _is_safe_split_point(self, lines: List[str], line_index: int) -> bool:
+    def _is_safe_split_point(self, stripped: List[str], line_index: int,
+                             classes: Dict[str, bytearray]) -> bool:
         """
         Check if a given line index is a safe point to split the content.
         
@@ -141,189 +558,106 @@ class MarkdownSplitter(ISplitter):
         that preserve Markdown syntax integrity.
         
         Args:
-            lines: List of all lines in the file
+            stripped: List of all lines in the file, stripped
             line_index: Line index to check
+            classes: Per-line flags from _classify
             
         Returns:
             True if it's safe to split at this point, False otherwise
         """
-        if line_index >= len(lines):
+        if line_index >= len(stripped):
             return True
         
         # Check if we're in the middle of a code block
-        if self._is_in_code_block(lines, line_index):
+        if classes['in_code'][line_index]:
             return False
         
         # Check if we're in the middle of a table
-        if self._is_in_table(lines, line_index):
+        if classes['in_table'][line_index]:
             return False
         
         # Check if we're in the middle of a list
-        if self._is_in_list_continuation(lines, line_index):
+        if classes['in_list'][line_index]:
             return False
         
         # Check if we're in the middle of a blockquote
-        if self._is_in_blockquote(lines, line_index):
+        if classes['in_blockquote'][line_index]:
             return False
         
         # Check if we're breaking a link reference definition
-        if self._is_in_link_reference(lines, line_index):
+        if classes['in_link_reference'][line_index]:
             return False
         
-        current_line = lines[line_index].strip()
-        
         # Excellent split points: after empty lines
-        if line_index > 0 and not lines[line_index - 1].strip():
+        if line_index > 0 and classes['is_blank'][line_index - 1]:
             return True
         
         # Excellent split points: before headers (but not setext headers)
-        if current_line.startswith('#') and not self._is_setext_header_underline(lines, line_index):
+        if classes['is_header'][line_index] and not classes['is_setext_underline'][line_index]:
             return True
         
         # Good split points: before horizontal rules
-        if self._is_horizontal_rule(current_line):
+        if classes['is_hr'][line_index]:
             return True
         
         # Good split points: before new sections or major blocks
-        if self._is_section_boundary(lines, line_index):
+        if self._is_section_boundary(stripped, line_index):
             return True
         
         # Avoid splitting right after headers
         if line_index > 0:
-            prev_line = lines[line_index - 1].strip()
-            if prev_line.startswith('#') or self._is_setext_header_underline(lines, line_index - 1):
+            if classes['is_header'][line_index - 1] or classes['is_setext_underline'][line_index - 1]:
                 return False
         
         # Avoid splitting in the middle of paragraphs (prefer paragraph boundaries)
-        if self._is_paragraph_continuation(lines, line_index):
+        if self._is_paragraph_continuation(stripped, classes['kind'], line_index):
             return False
         
         return True
     
-    def _is_in_blockquote(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the line is part of a blockquote structure.
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line is part of a blockquote
-        """
-        if line_index >= len(lines):
-            return False
-        
-        current_line = lines[line_index].strip()
-        
-        # Check if current line is a blockquote
-        if current_line.startswith('>'):
-            return True
-        
-        # Check if we're in a multi-line blockquote
-        # Look backwards for blockquote context
-        for i in range(line_index - 1, max(-1, line_index - 5), -1):
-            prev_line = lines[i].strip()
-            if not prev_line:  # Empty line might be part of blockquote
-                continue
-            if prev_line.startswith('>'):
-                # Check if current line could be a continuation
-                if current_line and not current_line.startswith('#'):
-                    return True
-            else:
-                break
-        
-        return False
-    
-    def _is_in_link_reference(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the line is part of a link reference definition.
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line is part of a link reference
-        """
-        if line_index >= len(lines):
-            return False
-        
-        # Look for link reference patterns: [label]: url "title"
-        for i in range(max(0, line_index - 2), min(len(lines), line_index + 3)):
-            line = lines[i].strip()
-            if line.startswith('[') and ']:' in line:
-                return True
-        
-        return False
-    
-    def _is_setext_header_underline(self, lines: List[str], line_index: int) -> bool:
+    def _is_setext_header_underline(self, stripped: List[str], line_index: int) -> bool:
         """
         Check if the line is a setext header underline (=== or ---).
         
         Args:
-            lines: List of all lines in the file
+            stripped: List of all lines in the file, stripped
             line_index: Line index to check
             
         Returns:
             True if the line is a setext header underline
         """
-        if line_index >= len(lines) or line_index == 0:
+        if line_index >= len(stripped) or line_index == 0:
             return False
         
-        current_line = lines[line_index].strip()
-        prev_line = lines[line_index - 1].strip()
+        current_line = stripped[line_index]
+        prev_line = stripped[line_index - 1]
         
         # Check if current line is all = or all -
         if (current_line and 
-            (all(c == '=' for c in current_line) or all(c == '-' for c in current_line)) and
+            set(current_line) in ({'='}, {'-'}) and
             prev_line and not prev_line.startswith('#')):
             return True
         
         return False
     
-    def _is_horizontal_rule(self, line: str) -> bool:
-        """
-        Check if the line is a horizontal rule.
-        
-        Args:
-            line: Line to check
-            
-        Returns:
-            True if the line is a horizontal rule
-        """
-        line = line.strip()
-        
-        # Must be at least 3 characters
-        if len(line) < 3:
-            return False
-        
-        # Check for different horizontal rule patterns
-        if (all(c in '- ' for c in line) and line.count('-') >= 3) or \
-           (all(c in '* ' for c in line) and line.count('*') >= 3) or \
-           (all(c in '_ ' for c in line) and line.count('_') >= 3):
-            return True
-        
-        return False
-    
-    def _is_section_boundary(self, lines: List[str], line_index: int) -> bool:
+    def _is_section_boundary(self, stripped: List[str], line_index: int) -> bool:
         """
         Check if this is a natural section boundary.
         
         Args:
-            lines: List of all lines in the file
+            stripped: List of all lines in the file, stripped
             line_index: Line index to check
             
         Returns:
             True if this is a good place to split sections
         """
-        if line_index >= len(lines):
+        if line_index >= len(stripped):
             return True
         
-        current_line = lines[line_index].strip()
+        current_line = stripped[line_index]
         
         # Before HTML comments
-        if current_line.startswith('<!--'):
+        if self._classify_line(current_line) & LINE_HTML_COMMENT:
             return True
         
         # Before YAML front matter
@@ -332,101 +666,42 @@ class MarkdownSplitter(ISplitter):
         
         return False
     
-    def _is_paragraph_continuation(self, lines: List[str], line_index: int) -> bool:
+    def _is_paragraph_continuation(self, stripped: List[str], kinds: bytearray, line_index: int) -> bool:
         """
         Check if the line is a continuation of a paragraph.
         
         Args:
-            lines: List of all lines in the file
+            stripped: List of all lines in the file, stripped
+            kinds: LINE_* flags of each line
             line_index: Line index to check
             
         Returns:
             True if the line continues a paragraph
         """
-        if line_index >= len(lines) or line_index == 0:
+        if line_index >= len(stripped) or line_index == 0:
             return False
         
-        current_line = lines[line_index].strip()
-        prev_line = lines[line_index - 1].strip()
+        current_line = stripped[line_index]
+        prev_line = stripped[line_index - 1]
         
         # If either line is empty, not a continuation
         if not current_line or not prev_line:
             return False
         
-        # If previous line is a special markdown element, not a continuation
-        if (prev_line.startswith('#') or 
-            prev_line.startswith('>') or 
-            prev_line.startswith('- ') or 
-            prev_line.startswith('* ') or 
-            prev_line.startswith('+ ') or
-            self._is_list_item_line(prev_line) or
-            self._is_horizontal_rule(prev_line)):
-            return False
-        
-        # If current line is a special markdown element, not a continuation
-        if (current_line.startswith('#') or 
-            current_line.startswith('>') or 
-            current_line.startswith('- ') or 
-            current_line.startswith('* ') or 
-            current_line.startswith('+ ') or
-            self._is_list_item_line(current_line) or
-            self._is_horizontal_rule(current_line)):
+        # If either line is a special markdown element, not a continuation
+        if (kinds[line_index - 1] | kinds[line_index]) & _PARAGRAPH_BREAKERS:
             return False
         
         # Both lines are regular text, likely a paragraph continuation
         return True
     
-    def _is_in_code_block(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the given line is inside a code block.
-        
-        This method detects both fenced code blocks (``` and ~~~) and indented code blocks.
-        It properly handles nested structures and different code block syntaxes.
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line is inside a code block, False otherwise
-        """
-        # Track different types of code blocks
-        triple_backtick_count = 0
-        triple_tilde_count = 0
-        
-        # Count code block markers from the beginning up to the current line
-        for i in range(line_index):
-            line = lines[i].strip()
-            
-            # Check for fenced code blocks with triple backticks
-            if line.startswith('```'):
-                triple_backtick_count += 1
-            
-            # Check for fenced code blocks with triple tildes
-            elif line.startswith('~~~'):
-                triple_tilde_count += 1
-        
-        # If we have an odd number of opening markers, we're inside a block
-        in_backtick_block = triple_backtick_count % 2 == 1
-        in_tilde_block = triple_tilde_count % 2 == 1
-        
-        # Also check for indented code blocks (4+ spaces or 1+ tabs at start of line)
-        in_indented_block = False
-        if line_index < len(lines):
-            current_line = lines[line_index]
-            # Check if this line and surrounding lines suggest an indented code block
-            if (current_line.startswith('    ') or current_line.startswith('\t')) and current_line.strip():
-                # Look at context to confirm it's a code block, not just indented text
-                in_indented_block = self._is_indented_code_block(lines, line_index)
-        
-        return in_backtick_block or in_tilde_block or in_indented_block
-    
-    def _is_indented_code_block(self, lines: List[str], line_index: int) -> bool:
+    def _is_indented_code_block(self, lines: List[str], stripped: List[str], line_index: int) -> bool:
         """
         Check if the current line is part of an indented code block.
         
         Args:
             lines: List of all lines in the file
+            stripped: The same lines, stripped
             line_index: Line index to check
             
         Returns:
@@ -451,7 +726,7 @@ class MarkdownSplitter(ISplitter):
             total_checked += 1
             
             # Skip empty lines
-            if not line.strip():
+            if not stripped[i]:
                 continue
                 
             # Count indented lines
@@ -461,214 +736,49 @@ class MarkdownSplitter(ISplitter):
         # If most non-empty lines in the window are indented, likely a code block
         return indented_lines >= 2 and total_checked > 0
     
-    def _is_in_table(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the given line is part of a table structure.
-        
-        This method detects Markdown tables by looking for table separator lines
-        and consistent pipe (|) usage across multiple lines.
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line is part of a table, False otherwise
-        """
-        if line_index >= len(lines):
-            return False
-        
-        current_line = lines[line_index].strip()
-        
-        # Quick check: if no pipes, definitely not a table
-        if '|' not in current_line:
-            return False
-        
-        # Look for table structure in a reasonable range
-        search_range = 5
-        start_search = max(0, line_index - search_range)
-        end_search = min(len(lines), line_index + search_range + 1)
-        
-        # Look for table separator line (header separator)
-        separator_found = False
-        table_lines = 0
-        
-        for i in range(start_search, end_search):
-            line = lines[i].strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
-            
-            # Check for table separator line (contains |, :, and -)
-            if self._is_table_separator_line(line):
-                separator_found = True
-            
-            # Count lines that look like table rows
-            elif '|' in line and self._is_table_row_line(line):
-                table_lines += 1
-        
-        # A table needs a separator and at least 2 table rows (header + data)
-        return separator_found and table_lines >= 2
-    
     def _is_table_separator_line(self, line: str) -> bool:
         """
         Check if a line is a table separator (header separator).
         
         Args:
-            line: Line to check
+            line: Stripped line to check
             
         Returns:
             True if the line is a table separator
         """
-        line = line.strip()
-        
         # Must contain pipes and dashes
         if '|' not in line or '-' not in line:
             return False
         
-        # Remove pipes and check if remaining content is mostly dashes and colons
+        # Remove pipes; what remains must be dashes, alignment colons and
+        # whitespace only, which str.translate checks in one C-level pass
         content = line.replace('|', '').strip()
-        if not content:
+        if not content or content.translate(_SEPARATOR_CHARS).strip():
             return False
         
-        # Split by spaces and check each segment
-        segments = [seg.strip() for seg in content.split() if seg.strip()]
-        
-        for segment in segments:
-            # Each segment should be dashes with optional colons for alignment
-            if not all(c in '-:' for c in segment):
-                return False
-            # Must have at least one dash
-            if '-' not in segment:
-                return False
-        
-        return len(segments) > 0
+        # Each segment must have at least one dash
+        return all('-' in segment for segment in content.split())
     
     def _is_table_row_line(self, line: str) -> bool:
         """
         Check if a line looks like a table row.
         
         Args:
-            line: Line to check
+            line: Stripped line to check
             
         Returns:
             True if the line looks like a table row
         """
-        line = line.strip()
-        
         # Must contain pipes
         if '|' not in line:
             return False
         
-        # Count pipes to ensure reasonable table structure
-        pipe_count = line.count('|')
-        
         # Should have at least 2 pipes for a meaningful table (| col1 | col2 |)
-        if pipe_count < 2:
+        if line.count('|') < 2:
             return False
         
         # Check if it's not just a line of pipes (which would be weird)
-        non_pipe_content = line.replace('|', '').replace(' ', '').replace('\t', '')
-        
-        return len(non_pipe_content) > 0
-    
-    def _is_in_list_continuation(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the given line is a continuation of a list item.
-        
-        This method detects both simple list continuations and nested list structures.
-        It handles unordered lists (-, *, +) and ordered lists (1., 2., etc.).
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line continues a list item, False otherwise
-        """
-        if line_index >= len(lines) or line_index == 0:
-            return False
-        
-        # Check if we're in the middle of a list structure
-        return self._is_in_list_structure(lines, line_index)
-    
-    def _is_in_list_structure(self, lines: List[str], line_index: int) -> bool:
-        """
-        Check if the current line is part of a list structure.
-        
-        Args:
-            lines: List of all lines in the file
-            line_index: Line index to check
-            
-        Returns:
-            True if the line is part of a list structure
-        """
-        current_line = lines[line_index]
-        
-        # Look backwards to find list context
-        list_context_found = False
-        current_indent = self._get_line_indent(current_line)
-        
-        # Search backwards for list items
-        for i in range(line_index - 1, max(-1, line_index - 10), -1):
-            prev_line = lines[i].strip()
-            
-            # Skip empty lines
-            if not prev_line:
-                continue
-            
-            # Check if this is a list item
-            if self._is_list_item_line(lines[i]):
-                list_context_found = True
-                prev_indent = self._get_line_indent(lines[i])
-                
-                # If current line is indented more than the list item, it's a continuation
-                if current_indent > prev_indent:
-                    return True
-                
-                # If current line is at same level and looks like a list item itself
-                if current_indent == prev_indent and self._is_list_item_line(current_line):
-                    return True
-                
-                break
-            
-            # If we hit a non-list, non-empty line with less indentation, stop searching
-            line_indent = self._get_line_indent(lines[i])
-            if line_indent < current_indent:
-                break
-        
-        return False
-    
-    def _is_list_item_line(self, line: str) -> bool:
-        """
-        Check if a line is a list item (ordered or unordered).
-        
-        Args:
-            line: Line to check
-            
-        Returns:
-            True if the line is a list item
-        """
-        stripped = line.strip()
-        
-        # Unordered list markers
-        if (stripped.startswith('- ') or 
-            stripped.startswith('* ') or 
-            stripped.startswith('+ ')):
-            return True
-        
-        # Ordered list markers (1. 2. 10. etc.)
-        if len(stripped) > 2:
-            # Find the first space
-            space_index = stripped.find(' ')
-            if space_index > 0:
-                prefix = stripped[:space_index]
-                # Check if it's a number followed by a dot
-                if prefix.endswith('.') and prefix[:-1].isdigit():
-                    return True
-        
-        return False
+        return bool(line.translate(_TABLE_ROW_TRIM))
     
     def _get_line_indent(self, line: str) -> int:
         """
@@ -680,15 +790,15 @@ class MarkdownSplitter(ISplitter):
         Returns:
             Number of spaces of indentation (tabs count as 4 spaces)
         """
-        indent = 0
-        for char in line:
-            if char == ' ':
-                indent += 1
-            elif char == '\t':
-                indent += 4
-            else:
-                break
-        return indent
+        # Length of the leading run of spaces and tabs, with each tab in it
+        # worth 3 more than the space it was counted as
+        prefix_length = len(line) - len(line.lstrip(' \t'))
+        return prefix_length + 3 * line.count('\t', 0, prefix_length)
+
+
+def _split_file_in_worker(file_path: str, chunk_size: int) -> List[FileChunk]:
+    """Split one file in a worker process for MarkdownSplitter.split_files."""
+    return MarkdownSplitter(chunk_size=chunk_size).split_file(file_path)
 
 
 def create_splitter(chunk_size: int = 500) -> MarkdownSplitter:
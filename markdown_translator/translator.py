@@ -6,22 +6,134 @@ with concurrent processing and error handling.
 """
 
 import asyncio
+import json
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import logging
 import random
-from typing import List, Optional, Dict, Any, Tuple
-from openai import OpenAI, APIError, RateLimitError, APITimeoutError
+import re
+from typing import List, Optional, Dict, Any, Tuple, Union, Callable
+from openai import AsyncOpenAI, OpenAI, APIError, RateLimitError, APITimeoutError
 from .interfaces import ITranslator, IValidator
 from .models import FileChunk, TranslationResult, TranslationStatus, ValidationResult
 from .performance import PerformanceMonitor
 from .security import SecurityManager
+from .cache import TranslationCache
+
+
+# Requirements listed in every translation system prompt
+_PROMPT_REQUIREMENTS = """要求：
+1. 保持所有Markdown语法结构完整（标题、列表、代码块、链接等）
+2. 只翻译文本内容，不要翻译代码、命令、文件名等技术内容
+3. 保持原有的换行和缩进格式
+4. 确保翻译准确、自然、符合中文表达习惯
+5. 不要添加任何额外的解释或注释"""
+
+# Fixed instructions, sent as the system message ahead of the content so the
+# request prefix is byte-identical across chunks and providers can serve it
+# from their prompt cache
+_SYSTEM_PROMPT = f"""请将用户发送的Markdown内容翻译成中文，保持所有Markdown格式不变。
+
+{_PROMPT_REQUIREMENTS}"""
+
+_BATCH_SYSTEM_PROMPT = f"""请将用户发送的多个Markdown片段分别翻译成中文，保持所有Markdown格式不变。
+每个片段以 <<<CHUNK id=N>>> 开始、以 <<<END N>>> 结束，请在译文中原样保留这些分隔行。
+
+{_PROMPT_REQUIREMENTS}
+6. 不要合并、拆分或省略任何片段"""
+
+# Error types by exception class, checked in order before generic APIError
+_ERROR_TYPES_BY_CLASS = (
+    (RateLimitError, "rate_limit"),
+    (APITimeoutError, "timeout"),
+)
+
+# Error types by APIError status code; other 5xx codes are server errors
+_ERROR_TYPES_BY_STATUS = {
+    429: "rate_limit",
+    401: "auth_error",
+    400: "client_error",
+}
+
+_RETRIABLE_ERROR_TYPES = frozenset({
+    "rate_limit", "timeout", "server_error", "connection_error", "unknown_error"
+})
+
+# Error messages of failed results that count as validation errors
+_VALIDATION_ERROR_RE = re.compile('validation', re.IGNORECASE)
+
+# Rate limit headers giving the time until the limit resets, in seconds,
+# as a duration such as "6m0s" or "20ms", or as a timestamp
+_RATE_LIMIT_RESET_HEADERS = (
+    'retry-after',
+    'x-ratelimit-reset-requests',
+    'x-ratelimit-reset-tokens',
+    'x-ratelimit-reset',
+)
+
+# Durations as used by x-ratelimit-reset-*: "1h2m3.5s", "6m0s", "20ms"
+_DURATION_RE = re.compile(
+    r'(?:(?P<h>\d+(?:\.\d+)?)h)?(?:(?P<m>\d+(?:\.\d+)?)m(?!s))?'
+    r'(?:(?P<s>\d+(?:\.\d+)?)s)?(?:(?P<ms>\d+(?:\.\d+)?)ms)?'
+)
+
+
+def _parse_reset_delay(value: str) -> Optional[float]:
+    """
+    Parse a rate limit reset header value into seconds from now.
+    
+    Args:
+        value: Header value: seconds, a duration, a Unix timestamp (seconds
+            or milliseconds), an HTTP date or an ISO 8601 time
+        
+    Returns:
+        Seconds until the reset, or None if the value is not recognized
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        # Large numbers are absolute Unix timestamps rather than delays
+        if number > 1e12:
+            return number / 1000.0 - time.time()
+        if number > 1e9:
+            return number - time.time()
+        return number
+    
+    match = _DURATION_RE.fullmatch(value)
+    if match and any(match.groups()):
+        return (float(match.group('h') or 0) * 3600 + float(match.group('m') or 0) * 60 +
+                float(match.group('s') or 0) + float(match.group('ms') or 0) / 1000.0)
+    
+    try:
+        reset_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return reset_at.timestamp() - time.time()
+
+
+# One chunk of a batched request or response: <<<CHUNK id=N>>> ... <<<END N>>>
+_BATCH_PART_RE = re.compile(r'<<<CHUNK id=(\d+)>>>\n?(.*?)\n?<<<END \1>>>', re.DOTALL)
 
 
 class RetryStrategy:
     """Configuration for retry behavior."""
     
+    # Supported jitter modes: "full" draws uniformly between 0 and the
+    # exponential delay, "decorrelated" between the base delay and three times
+    # the previous delay
+    JITTER_MODES = ("full", "decorrelated")
+    
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 300.0, 
-                 exponential_base: float = 2.0, jitter: bool = True):
+                 exponential_base: float = 2.0, jitter: bool = True, mode: str = "full"):
         """
         Initialize retry strategy.
         
@@ -31,17 +143,26 @@ class RetryStrategy:
             max_delay: Maximum delay in seconds
             exponential_base: Base for exponential backoff
             jitter: Whether to add random jitter to delays
+            mode: Jitter mode, "full" or "decorrelated"
         """
+        if mode not in self.JITTER_MODES:
+            raise ValueError(f"Unknown jitter mode: {mode}")
+        
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay  # Increased max delay to 300 seconds
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self.mode = mode
+        self._prev_delay = base_delay
     
     def get_delay(self, attempt: int) -> float:
         """
         Calculate delay for given attempt number.
         
+        Randomized delays spread over the whole backoff window, so chunks
+        that fail together do not retry together.
+        
         Args:
             attempt: Attempt number (0-based)
             
@@ -51,12 +172,84 @@ class RetryStrategy:
         delay = self.base_delay * (self.exponential_base ** attempt)
         delay = min(delay, self.max_delay)
         
-        if self.jitter:
-            # Add ±25% jitter
-            jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
+        if not self.jitter:
+            return max(0, delay)
+        
+        if self.mode == "decorrelated":
+            self._prev_delay = min(self.max_delay, random.uniform(self.base_delay, self._prev_delay * 3))
+            return self._prev_delay
         
-        return max(0, delay)
+        return random.uniform(0, delay)
+
+
+class TokenBucket:
+    """
+    Token bucket shared by all translation tasks to pace API usage.
+    
+    Tasks wait in arrival order, so a burst of chunks is spread out at the
+    configured rate instead of hitting the API at once. A pause (after a
+    rate limit response) stalls every task until the same instant.
+    """
+    
+    def __init__(self, per_minute: Optional[float] = None):
+        """
+        Initialize the bucket.
+        
+        Args:
+            per_minute: Tokens allowed per minute, or None for no limit
+                (pauses still apply)
+        """
+        self.rate = per_minute / 60.0 if per_minute else None
+        self.capacity = float(per_minute) if per_minute else 0.0
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, cost: float = 1.0) -> None:
+        """
+        Wait until the given number of tokens is available and take them.
+        
+        Args:
+            cost: Number of tokens to take (capped at the bucket capacity)
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                
+                if self.rate is None:
+                    return
+                
+                elapsed = now - self.last
+                if elapsed > 0:
+                    self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                    self.last = now
+                
+                cost = min(cost, self.capacity)
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                
+                await asyncio.sleep((cost - self.tokens) / self.rate)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for the given number of seconds.
+        
+        The bucket starts empty when the pause ends, so waiting tasks resume
+        at the configured rate rather than all at once.
+        
+        Args:
+            seconds: Pause duration in seconds
+        """
+        resume_at = time.monotonic() + seconds
+        if resume_at > self._resume_at:
+            self._resume_at = resume_at
+            self.tokens = min(self.tokens, 0.0)
+            self.last = resume_at
 
 
 class TranslationPool(ITranslator):
@@ -65,51 +258,164 @@ class TranslationPool(ITranslator):
     
     This class implements the ITranslator interface and provides:
     - Asynchronous translation processing with configurable concurrency
-    - Semaphore-based concurrency control
+    - Condition-based concurrency control that can be resized under load
     - OpenRouter API integration
+    - Batching of small chunks into shared API requests
     - Exponential backoff retry mechanism
     - API rate limiting handling
     - Integrity validation integration
     - Error classification and recovery
     """
     
-    def __init__(self, concurrency: int = 5, api_client: Optional[OpenAI] = None, 
+    # A latency budget of at least the Batch API completion window sends the
+    # chunks as one asynchronous batch job instead of live requests
+    BATCH_API_COMPLETION_WINDOW = "24h"
+    BATCH_API_MIN_LATENCY_MS = 24 * 60 * 60 * 1000
+    BATCH_API_POLL_INTERVAL = 10.0
+    BATCH_API_MAX_POLL_INTERVAL = 300.0
+    
+    # Output token budget per request: 1.2 tokens per input character,
+    # clamped to this range, so providers do not reserve the full maximum
+    # for small chunks
+    MIN_OUTPUT_TOKENS = 256
+    MAX_OUTPUT_TOKENS = 8000
+    
+    # Small consecutive chunks are sent together in one request, up to this
+    # many estimated input tokens and this many chunks per request. Chinese
+    # output can take up to 1.5 tokens per input token, so the input limit
+    # keeps a full batch's translation within the output budget.
+    BATCH_OUTPUT_RATIO = 1.5
+    MAX_BATCH_TOKENS = int(MAX_OUTPUT_TOKENS / BATCH_OUTPUT_RATIO)
+    MAX_BATCH_CHUNKS = 10
+    
+    # Adaptive concurrency: one more slot after this many successful calls
+    # in a row, and at most one halving per cooldown, since requests already
+    # in flight when the limit is cut tend to fail the same way
+    ADAPTIVE_INCREASE_AFTER = 20
+    ADAPTIVE_DECREASE_COOLDOWN = 5.0
+    
+    # Models whose providers only cache a prompt prefix marked with
+    # cache_control (Anthropic models, directly or through OpenRouter);
+    # other providers cache automatically or reject the extra field
+    CACHE_CONTROL_MODEL_PREFIXES = ('anthropic/', 'claude-')
+    
+    # Streamed output is security-checked each time this many more characters
+    # have arrived, so a rejected response is cancelled before it completes.
+    # Each check covers the new text plus this many characters before it.
+    STREAM_CHECK_INTERVAL = 4096
+    STREAM_CHECK_OVERLAP = 256
+    
+    def __init__(self, concurrency: int = 5, api_client: Optional[Union[AsyncOpenAI, OpenAI]] = None, 
                  validator: Optional[IValidator] = None, retry_strategy: Optional[RetryStrategy] = None,
                  performance_monitor: Optional[PerformanceMonitor] = None,
-                 security_manager: Optional[SecurityManager] = None):
+                 security_manager: Optional[SecurityManager] = None,
+                 requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None,
+                 batch_chunks: bool = True,
+                 cache: Optional[TranslationCache] = None,
+                 model_name: Optional[str] = None,
+                 adaptive_concurrency: bool = False,
+                 max_concurrency: Optional[int] = None):
         """
         Initialize the translation pool.
         
         Args:
             concurrency: Maximum number of concurrent translation tasks
-            api_client: Configured OpenAI client for API calls
+            api_client: Configured AsyncOpenAI client for API calls (a sync
+                OpenAI client is also accepted and run in a worker thread)
             validator: Content integrity validator
             retry_strategy: Retry configuration
             performance_monitor: Performance monitoring instance
             security_manager: Security manager instance
+            requests_per_minute: API request limit shared by all tasks (None for no limit)
+            tokens_per_minute: Estimated prompt token limit shared by all tasks (None for no limit)
+            batch_chunks: Whether to send small consecutive chunks in one request
+            cache: Cache of validated translations, checked before any API call
+            model_name: Model to translate with (default: the model of the
+                config manager attached to the API client; one of the two
+                is required)
+            adaptive_concurrency: Whether to halve concurrency on rate limit
+                and server errors and raise it again while calls succeed
+            max_concurrency: Upper bound for adaptive concurrency (default:
+                the initial concurrency)
         """
+        if not api_client:
+            raise ValueError("API client is required for translation")
+        
         self.concurrency = concurrency
-        self.api_client = api_client
+        self.api_client: Union[AsyncOpenAI, OpenAI] = api_client
         self.validator = validator
         self.retry_strategy = retry_strategy or RetryStrategy(max_retries=5)  # Increase max retries to 5
         self.performance_monitor = performance_monitor
         self.security_manager = security_manager
-        self.semaphore = asyncio.Semaphore(concurrency)
+        self.batch_chunks = batch_chunks
+        self._max_batch_tokens = self.MAX_BATCH_TOKENS  # Halved when a batch hits the output limit
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
         
-        # Rate limiting state
-        self._rate_limit_delay = 0.0
-        self._last_rate_limit_time = 0.0
+        # Translations to store in the cache, written together when a run ends
+        self._pending_cache_writes: List[Tuple[bytes, str]] = []
         
-        if not self.api_client:
-            raise ValueError("API client is required for translation")
+        # Admission control: number of chunks in flight, guarded by a condition
+        # so set_concurrency can change the limit without replacing the primitive
+        self._active = 0
+        self._slots = asyncio.Condition()
+        self._wake_task: Optional[asyncio.Task] = None
+        
+        # Rate limiting state shared by all tasks: requests and prompt tokens
+        # are independent ceilings, each paced by its own bucket
+        self._rpm_bucket = TokenBucket(requests_per_minute)
+        self._tpm_bucket = TokenBucket(tokens_per_minute)
+        
+        # Additive-increase/multiplicative-decrease state
+        self.adaptive_concurrency = adaptive_concurrency
+        self.max_concurrency = max_concurrency or concurrency
+        self._successes_since_decrease = 0
+        self._last_decrease = float('-inf')
+        
+        # Resolved once; every request and cache key uses it
+        if model_name is None and hasattr(api_client, '_config_manager'):
+            model_name = api_client._config_manager.get_model_name()
+        if not model_name:
+            raise ValueError("Model name is required for translation")
+        self._model_name: str = model_name
     
-    async def translate_chunks(self, chunks: List[FileChunk]) -> List[TranslationResult]:
+    async def translate_chunks(self, chunks: List[FileChunk],
+                               latency_budget_ms: Optional[int] = None,
+                               on_result: Optional[Callable[[TranslationResult], None]] = None
+                               ) -> List[TranslationResult]:
         """
         Translate a list of file chunks concurrently.
         
         Args:
             chunks: List of FileChunk objects to translate
+            latency_budget_ms: How long the caller can wait for results; a
+                budget covering the Batch API completion window routes the
+                chunks through translate_chunks_batch_api
+            on_result: Called with each result as soon as it and the results
+                of all chunks before it are available, in chunk order, so a
+                consumer can start writing output before the slowest chunk
+                finishes
+            
+        Returns:
+            List of TranslationResult objects with translation results
+        """
+        try:
+            return await self._translate_chunks(chunks, latency_budget_ms, on_result)
+        finally:
+            await self._flush_cache()
+    
+    async def _translate_chunks(self, chunks: List[FileChunk],
+                                latency_budget_ms: Optional[int] = None,
+                                on_result: Optional[Callable[[TranslationResult], None]] = None
+                                ) -> List[TranslationResult]:
+        """
+        Translate a list of file chunks concurrently, without flushing the cache.
+        
+        Args:
+            chunks: List of FileChunk objects to translate
+            latency_budget_ms: As for translate_chunks
+            on_result: As for translate_chunks
             
         Returns:
             List of TranslationResult objects with translation results
@@ -117,42 +423,152 @@ class TranslationPool(ITranslator):
         if not chunks:
             return []
         
-        self.logger.info(f"Starting translation of {len(chunks)} chunks with concurrency {self.concurrency}")
+        emit = self._ordered_emitter(chunks, on_result) if on_result else None
         
-        # Create translation tasks
-        tasks = []
-        for chunk in chunks:
-            task = asyncio.create_task(self._translate_single_chunk_with_semaphore(chunk))
-            tasks.append(task)
+        # Chunks translated before with the same prompt and model need no API call
+        cached = await self._cached_results(chunks)
+        if cached:
+            self.logger.info("Reusing cached translations for %d of %d chunks", len(cached), len(chunks))
+            if emit:
+                for result in cached.values():
+                    emit(result)
+            uncached = [chunk for chunk in chunks if chunk.id not in cached]
+            results = {result.chunk_id: result for result in
+                       await self._translate_uncached(uncached, latency_budget_ms, emit)} if uncached else {}
+            results.update(cached)
+            return [results[chunk.id] for chunk in chunks]
+        
+        return await self._translate_uncached(chunks, latency_budget_ms, emit)
+    
+    async def _translate_uncached(self, chunks: List[FileChunk],
+                                  latency_budget_ms: Optional[int] = None,
+                                  emit: Optional[Callable[[TranslationResult], None]] = None
+                                  ) -> List[TranslationResult]:
+        """
+        Translate chunks already known to miss the cache.
+        
+        Args:
+            chunks: List of FileChunk objects to translate
+            latency_budget_ms: As for translate_chunks
+            emit: Callback for each result, in any order
+            
+        Returns:
+            List of TranslationResult objects, in chunk order
+        """
+        if not chunks:
+            return []
+        
+        if latency_budget_ms is not None and latency_budget_ms >= self.BATCH_API_MIN_LATENCY_MS:
+            translation_results = await self.translate_chunks_batch_api(chunks)
+            if emit:
+                for result in translation_results:
+                    emit(result)
+            return translation_results
         
-        # Wait for all translations to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.logger.info("Starting translation of %d chunks with concurrency %d", len(chunks), self.concurrency)
         
-        # Process results and handle exceptions
-        translation_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+        # Work is queued by the position of its first chunk, so chunks sent
+        # back by a failed batch are dispatched before later groups
+        positions = {chunk.id: position for position, chunk in enumerate(chunks)}
+        work: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        for group in self._group_chunks(chunks):
+            work.put_nowait((positions[group[0].id], group))
+        finished: asyncio.Queue = asyncio.Queue()
+        running = set()
+        
+        async def translate_group(group: List[FileChunk]) -> None:
+            results: List[Optional[TranslationResult]]
+            try:
+                results = await self._translate_group(group)
+            except Exception as e:
                 # Create a failed result for exceptions
-                chunk = chunks[i]
-                failed_result = TranslationResult(
-                    chunk_id=chunk.id,
-                    original_content=chunk.content,
-                    translated_content="",
-                    success=False,
-                    sequence_number=chunk.sequence_number,
-                    error_message=str(result),
-                    status=TranslationStatus.FAILED
-                )
-                translation_results.append(failed_result)
-                self.logger.error(f"Translation failed for chunk {chunk.id}: {result}")
-            else:
-                translation_results.append(result)
+                results = []
+                for chunk in group:
+                    results.append(TranslationResult(
+                        chunk_id=chunk.id,
+                        original_content=chunk.content,
+                        translated_content="",
+                        success=False,
+                        sequence_number=chunk.sequence_number,
+                        error_message=str(e),
+                        status=TranslationStatus.FAILED
+                    ))
+                    self.logger.error("Translation failed for chunk %s: %s", chunk.id, e)
+            finally:
+                await self._release_slot()
+            
+            # Chunks a batched request could not translate go back to the
+            # dispatcher one by one, so each retry loop takes its own slot
+            completed = []
+            for chunk, result in zip(group, results):
+                if result is None:
+                    work.put_nowait((positions[chunk.id], [chunk]))
+                else:
+                    completed.append(result)
+            finished.put_nowait(completed)
+        
+        async def dispatch() -> None:
+            # A task is only created once it has a slot, so at most
+            # `concurrency` request tasks exist at a time
+            while True:
+                _, group = await work.get()
+                await self._acquire_slot()
+                task = asyncio.create_task(translate_group(group))
+                running.add(task)
+                task.add_done_callback(running.discard)
+        
+        dispatcher = asyncio.create_task(dispatch())
+        
+        # Collect results as each request finishes rather than after the last one
+        results_by_id: Dict[str, TranslationResult] = {}
+        try:
+            while len(results_by_id) < len(positions):
+                for result in await finished.get():
+                    results_by_id[result.chunk_id] = result
+                    if emit:
+                        emit(result)
+        finally:
+            # The dispatcher waits for more work until it is cancelled here
+            dispatcher.cancel()
+            for task in list(running):
+                task.cancel()
+        
+        translation_results = [results_by_id[chunk.id] for chunk in chunks]
         
         successful = sum(1 for r in translation_results if r.success)
-        self.logger.info(f"Translation completed: {successful}/{len(chunks)} successful")
+        self.logger.info("Translation completed: %d/%d successful", successful, len(chunks))
         
         return translation_results
     
+    @staticmethod
+    def _ordered_emitter(chunks: List[FileChunk],
+                         on_result: Callable[[TranslationResult], None]) -> Callable[[TranslationResult], None]:
+        """
+        Wrap a result callback so results reach it in chunk order.
+        
+        Results that arrive ahead of an earlier chunk are held back until
+        every chunk before them has a result.
+        
+        Args:
+            chunks: Chunks in the order their results should be delivered
+            on_result: Callback to deliver results to
+            
+        Returns:
+            Function accepting results in any order
+        """
+        order = [chunk.id for chunk in chunks]
+        pending: Dict[str, TranslationResult] = {}
+        position = 0
+        
+        def emit(result: TranslationResult) -> None:
+            nonlocal position
+            pending[result.chunk_id] = result
+            while position < len(order) and order[position] in pending:
+                on_result(pending.pop(order[position]))
+                position += 1
+        
+        return emit
+    
     async def translate_single_chunk(self, chunk: FileChunk) -> TranslationResult:
         """
         Translate a single file chunk.
@@ -163,11 +579,153 @@ class TranslationPool(ITranslator):
         Returns:
             TranslationResult object with the translation result
         """
-        return await self._translate_single_chunk_with_semaphore(chunk)
+        cached = await self._cached_results([chunk])
+        if cached:
+            return cached[chunk.id]
+        
+        try:
+            return await self._translate_chunk_with_limit(chunk)
+        finally:
+            await self._flush_cache()
     
-    async def _translate_single_chunk_with_semaphore(self, chunk: FileChunk) -> TranslationResult:
+    def _cache_keys(self, chunk: FileChunk) -> Tuple[bytes, ...]:
         """
-        Translate a single chunk with semaphore control.
+        Compute the translation cache keys for a chunk.
+        
+        Args:
+            chunk: Chunk to look up or store
+            
+        Returns:
+            Exact key followed by the near-duplicate key, or no keys if
+            caching is disabled or the chunk opts out
+        """
+        if self.cache is None or chunk.no_cache:
+            return ()
+        return (
+            TranslationCache.make_key(self._model_name, self._create_translation_prompt(chunk.content), _SYSTEM_PROMPT),
+            TranslationCache.make_near_key(self._model_name, chunk.content),
+        )
+    
+    async def _cached_results(self, chunks: List[FileChunk]) -> Dict[str, TranslationResult]:
+        """
+        Build results for the chunks whose translation is already cached.
+        
+        All keys are looked up in one query, in a worker thread so the
+        database read does not block the event loop.
+        
+        Args:
+            chunks: Chunks to look up
+            
+        Returns:
+            Completed TranslationResult for each cache hit, keyed by chunk ID
+        """
+        results: Dict[str, TranslationResult] = {}
+        if self.cache is None:
+            return results
+        
+        chunk_keys = [(chunk, self._cache_keys(chunk)) for chunk in chunks]
+        found = await asyncio.to_thread(
+            self.cache.get_many, [key for _, keys in chunk_keys for key in keys]
+        )
+        if not found:
+            return results
+        
+        for chunk, keys in chunk_keys:
+            if not keys:
+                continue
+            exact_key, near_key = keys
+            translated_content = found.get(exact_key)
+            if translated_content is None:
+                translated_content = found.get(near_key)
+                if translated_content is not None and not self._near_hit_matches(chunk, translated_content):
+                    translated_content = None
+            if translated_content is not None:
+                results[chunk.id] = TranslationResult(
+                    chunk_id=chunk.id,
+                    original_content=chunk.content,
+                    translated_content=translated_content,
+                    success=True,
+                    sequence_number=chunk.sequence_number,
+                    status=TranslationStatus.COMPLETED
+                )
+        
+        return results
+    
+    def _near_hit_matches(self, chunk: FileChunk, translated_content: str) -> bool:
+        """
+        Check a near-duplicate cache hit against the chunk it would be used for.
+        
+        The cached translation was made for content that differs in
+        whitespace, for example in the length of blank-line runs. It is only
+        used if it has as many lines as this chunk and, with a validator,
+        passes validation against it like a fresh translation.
+        
+        Args:
+            chunk: Chunk being looked up
+            translated_content: Translation cached under its near-duplicate key
+            
+        Returns:
+            True if the translation can be used for the chunk
+        """
+        if len(chunk.content.strip('\n').splitlines()) != len(translated_content.splitlines()):
+            return False
+        if self.validator:
+            return self.validator.validate_translation(chunk.content, translated_content).is_valid
+        return True
+    
+    def _store_in_cache(self, chunk: FileChunk, translated_content: str) -> None:
+        """
+        Queue a validated, marker-free translation for the cache.
+        
+        Args:
+            chunk: Chunk that was translated
+            translated_content: Its translated content
+        """
+        for key in self._cache_keys(chunk):
+            self._pending_cache_writes.append((key, translated_content))
+    
+    async def _flush_cache(self) -> None:
+        """Write queued translations to the cache in one transaction, off the event loop."""
+        if self.cache is None or not self._pending_cache_writes:
+            return
+        
+        entries, self._pending_cache_writes = self._pending_cache_writes, []
+        await asyncio.to_thread(self.cache.set_many, entries)
+    
+    def _group_chunks(self, chunks: List[FileChunk]) -> List[List[FileChunk]]:
+        """
+        Group consecutive small chunks that can share one API request.
+        
+        Args:
+            chunks: Chunks in sequence order
+            
+        Returns:
+            List of chunk groups in the same order; large chunks, and all
+            chunks when batching is disabled, form groups of one
+        """
+        if not self.batch_chunks:
+            return [[chunk] for chunk in chunks]
+        
+        groups: List[List[FileChunk]] = []
+        current: List[FileChunk] = []
+        current_tokens = 0
+        for chunk in chunks:
+            tokens = len(chunk.content) // 4
+            if current and (current_tokens + tokens > self._max_batch_tokens or
+                            len(current) >= self.MAX_BATCH_CHUNKS):
+                groups.append(current)
+                current = []
+                current_tokens = 0
+            current.append(chunk)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        
+        return groups
+    
+    async def _translate_chunk_with_limit(self, chunk: FileChunk) -> TranslationResult:
+        """
+        Translate a single chunk once a concurrency slot is free.
         
         Args:
             chunk: FileChunk to translate
@@ -175,8 +733,44 @@ class TranslationPool(ITranslator):
         Returns:
             TranslationResult with translation outcome
         """
-        async with self.semaphore:
+        await self._acquire_slot()
+        try:
             return await self._translate_chunk_internal(chunk)
+        finally:
+            await self._release_slot()
+    
+    async def _acquire_slot(self) -> None:
+        """
+        Wait for a free concurrency slot and take it.
+        
+        The limit is re-read every time a waiter wakes, so a change made by
+        set_concurrency applies to tasks that are already waiting.
+        """
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._active < self.concurrency)
+            self._active += 1
+    
+    async def _release_slot(self) -> None:
+        """Give back a concurrency slot and wake one waiter."""
+        async with self._slots:
+            self._active -= 1
+            self._slots.notify(1)
+    
+    async def _translate_group(self, chunks: List[FileChunk]) -> List[Optional[TranslationResult]]:
+        """
+        Translate a group of chunks, batched into one request if there are
+        several.
+        
+        Args:
+            chunks: Chunks sharing one request (a single chunk is sent alone)
+            
+        Returns:
+            TranslationResult for each chunk, in the same order; None for a
+            chunk of a batch that has to be translated on its own
+        """
+        if len(chunks) == 1:
+            return [await self._translate_chunk_internal(chunks[0])]
+        return await self._translate_batch(chunks)
     
     async def _translate_chunk_internal(self, chunk: FileChunk) -> TranslationResult:
         """
@@ -211,39 +805,40 @@ class TranslationPool(ITranslator):
                     status=TranslationStatus.FAILED
                 )
         
+        # Prepare content with integrity markers if validator is available;
+        # the marked content and prompt are the same for every attempt
+        content_to_translate = chunk.content
+        if self.validator:
+            content_to_translate = self.validator.add_markers(chunk.content)
+        
+        # Create translation prompt
+        prompt = self._create_translation_prompt(content_to_translate)
+        prompt_tokens = len(prompt) // 4
+        
         for attempt in range(self.retry_strategy.max_retries + 1):
             try:
-                self.logger.debug(f"Translation attempt {attempt + 1} for chunk {chunk.id}")
-                
-                # Apply rate limiting delay if needed
-                await self._apply_rate_limit_delay()
-                
-                # Prepare content with integrity markers if validator is available
-                content_to_translate = chunk.content
-                if self.validator:
-                    content_to_translate = self.validator.add_markers(chunk.content)
+                self.logger.debug("Translation attempt %d for chunk %s", attempt + 1, chunk.id)
                 
-                # Create translation prompt
-                prompt = self._create_translation_prompt(content_to_translate)
+                # Wait for the shared request and token budgets
+                await self._rpm_bucket.acquire(1)
+                await self._tpm_bucket.acquire(prompt_tokens)
                 
                 # Make API call with retry handling and performance monitoring
                 api_start_time = time.time()
-                response = await asyncio.to_thread(
-                    self._make_api_call_with_retry,
-                    prompt
-                )
+                response = await self._make_api_call_with_retry(prompt)
                 api_duration = time.time() - api_start_time
                 
                 # Record API performance
                 if self.performance_monitor:
                     self.performance_monitor.record_api_call(api_duration, True)
+                self._adjust_concurrency()
                 
                 # Security validation of API response
                 if self.security_manager:
                     response_validation = self.security_manager.validate_api_response(response)
                     if not response_validation.is_valid and response_validation.risk_level == 'high':
                         error_msg = f"API response security validation failed: {', '.join(response_validation.issues)}"
-                        self.logger.warning(f"Chunk {chunk.id} API response validation failed: {error_msg}")
+                        self.logger.warning("Chunk %s API response validation failed: %s", chunk.id, error_msg)
                         if attempt < self.retry_strategy.max_retries:
                             await self._apply_retry_delay(attempt)
                             continue
@@ -273,7 +868,7 @@ class TranslationPool(ITranslator):
                     if not validation_result.is_valid:
                         # Validation failed, treat as retriable error
                         error_msg = f"Validation failed: {', '.join(validation_result.issues)}"
-                        self.logger.warning(f"Chunk {chunk.id} validation failed on attempt {attempt + 1}: {error_msg}")
+                        self.logger.warning("Chunk %s validation failed on attempt %d: %s", chunk.id, attempt + 1, error_msg)
                         
                         if attempt < self.retry_strategy.max_retries:
                             await self._apply_retry_delay(attempt)
@@ -297,6 +892,7 @@ class TranslationPool(ITranslator):
                     translated_content = self.validator.remove_markers(translated_content)
                 
                 # Success!
+                self._store_in_cache(chunk, translated_content)
                 processing_time = time.time() - start_time
                 
                 # Record chunk processing performance
@@ -314,7 +910,8 @@ class TranslationPool(ITranslator):
                     status=TranslationStatus.COMPLETED
                 )
                 
-                self.logger.debug(f"Translation completed for chunk {chunk.id} in {processing_time:.2f}s after {attempt + 1} attempts")
+                self.logger.debug("Translation completed for chunk %s in %.2fs after %d attempts",
+                                  chunk.id, processing_time, attempt + 1)
                 return result
                 
             except Exception as e:
@@ -325,8 +922,9 @@ class TranslationPool(ITranslator):
                 if self.performance_monitor and 'api_start_time' in locals():
                     api_duration = time.time() - api_start_time
                     self.performance_monitor.record_api_call(api_duration, False)
+                self._adjust_concurrency(error_type)
                 
-                self.logger.warning(f"Translation attempt {attempt + 1} failed for chunk {chunk.id}: {e}")
+                self.logger.warning("Translation attempt %d failed for chunk %s: %s", attempt + 1, chunk.id, e)
                 
                 # Check if error is retriable
                 if not self._is_retriable_error(error_type) or attempt >= self.retry_strategy.max_retries:
@@ -355,38 +953,367 @@ class TranslationPool(ITranslator):
             status=TranslationStatus.FAILED
         )
         
-        self.logger.error(f"Translation failed for chunk {chunk.id} after {self.retry_strategy.max_retries + 1} attempts: {error_message}")
+        self.logger.error("Translation failed for chunk %s after %d attempts: %s",
+                          chunk.id, self.retry_strategy.max_retries + 1, error_message)
         return result
     
+    async def _translate_batch(self, chunks: List[FileChunk]) -> List[Optional[TranslationResult]]:
+        """
+        Translate several small chunks with a single API request.
+        
+        Each chunk's translation is validated on its own. Chunks that are
+        missing from the response or fail validation, and the whole group if
+        the request itself fails, are left for the caller to translate
+        individually, each under its own concurrency slot.
+        
+        Args:
+            chunks: Chunks to translate together
+            
+        Returns:
+            TranslationResult for each chunk, in the same order; None for
+            each chunk that has to be translated on its own
+        """
+        start_time = time.time()
+        
+        # Content rejected by the security check is reported per chunk
+        if self.security_manager:
+            for chunk in chunks:
+                content_validation = self.security_manager.validate_content(chunk.content)
+                if not content_validation.is_valid and content_validation.risk_level == 'high':
+                    return [None] * len(chunks)
+        
+        contents = [chunk.content for chunk in chunks]
+        if self.validator:
+            contents = [self.validator.add_markers(content) for content in contents]
+        prompt = self._create_batch_translation_prompt(contents)
+        
+        api_start_time = None
+        response = None
+        try:
+            await self._rpm_bucket.acquire(1)
+            await self._tpm_bucket.acquire(len(prompt) // 4)
+            
+            api_start_time = time.time()
+            response = await self._make_api_call_with_retry(prompt, _BATCH_SYSTEM_PROMPT)
+            if self.performance_monitor:
+                self.performance_monitor.record_api_call(time.time() - api_start_time, True)
+            self._adjust_concurrency()
+            
+            if self.security_manager:
+                response_validation = self.security_manager.validate_api_response(response)
+                if not response_validation.is_valid and response_validation.risk_level == 'high':
+                    raise ValueError(f"API response security validation failed: {', '.join(response_validation.issues)}")
+            
+            translations = self._split_batch_translation(
+                self._extract_translation_from_response(response), len(chunks)
+            )
+            if all(translation is None for translation in translations):
+                raise ValueError("Batched response does not contain any chunk")
+            
+            # Parts after the output limit are missing and go out individually;
+            # later batches are made smaller so the limit is not hit again
+            if response["choices"][0].get("finish_reason") == "length":
+                self._max_batch_tokens = max(self._max_batch_tokens // 2, self.MIN_OUTPUT_TOKENS)
+                self.logger.warning("Batched response of %d chunks hit the output limit, "
+                                    "limiting batches to %d tokens", len(chunks), self._max_batch_tokens)
+            
+        except Exception as e:
+            if self.performance_monitor and api_start_time is not None and response is None:
+                self.performance_monitor.record_api_call(time.time() - api_start_time, False)
+            error_type = self._classify_error(e)
+            self._adjust_concurrency(error_type)
+            if error_type == "rate_limit":
+                await self._handle_rate_limit_error(e)
+            
+            self.logger.warning("Batched translation of %d chunks failed, translating them individually: %s",
+                                len(chunks), e)
+            return [None] * len(chunks)
+        
+        results: List[Optional[TranslationResult]] = []
+        for chunk, content, translated_content in zip(chunks, contents, translations):
+            if translated_content is None:
+                self.logger.warning("Chunk %s is missing from a batched response, translating it individually", chunk.id)
+                results.append(None)
+                continue
+            
+            if self.validator:
+                validation_result = self.validator.validate_translation(content, translated_content)
+                if not validation_result.is_valid:
+                    self.logger.warning("Chunk %s failed validation in a batch, translating it individually", chunk.id)
+                    results.append(None)
+                    continue
+                translated_content = self.validator.remove_markers(translated_content)
+            
+            self._store_in_cache(chunk, translated_content)
+            processing_time = time.time() - start_time
+            if self.performance_monitor:
+                self.performance_monitor.record_chunk_processing(processing_time)
+            
+            results.append(TranslationResult(
+                chunk_id=chunk.id,
+                original_content=chunk.content,
+                translated_content=translated_content,
+                success=True,
+                sequence_number=chunk.sequence_number,
+                retry_count=0,
+                processing_time=processing_time,
+                status=TranslationStatus.COMPLETED
+            ))
+        
+        return results
+    
     def _create_translation_prompt(self, content: str) -> str:
         """
-        Create a translation prompt for the given content.
+        Create the user message of a translation request.
+        
+        The instructions are sent separately as _SYSTEM_PROMPT, so the user
+        message is the content alone.
         
         Args:
             content: Content to translate
             
         Returns:
-            Formatted prompt for translation
+            User message for translation
         """
-        prompt = f"""请将以下Markdown内容翻译成中文，保持所有Markdown格式不变：
-
-{content}
-
-要求：
-1. 保持所有Markdown语法结构完整（标题、列表、代码块、链接等）
-2. 只翻译文本内容，不要翻译代码、命令、文件名等技术内容
-3. 保持原有的换行和缩进格式
-4. 确保翻译准确、自然、符合中文表达习惯
-5. 不要添加任何额外的解释或注释"""
+        return content
+    
+    def _create_batch_translation_prompt(self, contents: List[str]) -> str:
+        """
+        Create the user message of a request covering several chunks, to be
+        sent with _BATCH_SYSTEM_PROMPT.
+        
+        Args:
+            contents: Content of each chunk, in order
+            
+        Returns:
+            User message with each chunk between numbered delimiters
+        """
+        parts = "\n\n".join(
+            f"<<<CHUNK id={index}>>>\n{content}\n<<<END {index}>>>"
+            for index, content in enumerate(contents, 1)
+        )
+        return f"以下共{len(contents)}个片段：\n\n{parts}"
+    
+    def _split_batch_translation(self, translated: str, count: int) -> List[Optional[str]]:
+        """
+        Split a batched translation back into per-chunk translations.
+        
+        Args:
+            translated: Translated response text
+            count: Number of chunks in the request
+            
+        Returns:
+            Translation of each chunk in order, None for chunks missing from
+            the response or left empty
+        """
+        parts = {}
+        for match in _BATCH_PART_RE.finditer(translated):
+            content = match.group(2).strip()
+            if content:
+                parts[int(match.group(1))] = content
+        
+        return [parts.get(index) for index in range(1, count + 1)]
+    
+    async def translate_chunks_batch_api(self, chunks: List[FileChunk]) -> List[TranslationResult]:
+        """
+        Translate chunks through the OpenAI-compatible Batch API.
+        
+        All chunks are submitted as one batch job, which providers bill at a
+        discount and outside the per-minute rate limits, then polled until
+        it finishes. Chunks the job does not translate successfully, and all
+        of them if the job fails, go through the live path instead.
+        
+        Args:
+            chunks: List of FileChunk objects to translate
+            
+        Returns:
+            List of TranslationResult objects, in the same order as chunks
+        """
+        if not chunks:
+            return []
+        
+        start_time = time.time()
+        results: Dict[str, TranslationResult] = {}
+        requests = {}
+        for chunk in chunks:
+            if self.security_manager:
+                content_validation = self.security_manager.validate_content(chunk.content)
+                if not content_validation.is_valid and content_validation.risk_level == 'high':
+                    results[chunk.id] = TranslationResult(
+                        chunk_id=chunk.id,
+                        original_content=chunk.content,
+                        translated_content="",
+                        success=False,
+                        sequence_number=chunk.sequence_number,
+                        error_message=f"Security validation failed: {', '.join(content_validation.issues)}",
+                        status=TranslationStatus.FAILED
+                    )
+                    continue
+            
+            content_to_translate = chunk.content
+            if self.validator:
+                content_to_translate = self.validator.add_markers(chunk.content)
+            requests[chunk.id] = content_to_translate
+        
+        try:
+            output = await self._run_batch_job(requests)
+        except Exception as e:
+            self.logger.warning("Batch API job failed, translating %d chunks live: %s", len(requests), e)
+            output = {}
+        
+        for chunk in chunks:
+            response = output.get(chunk.id)
+            if chunk.id in results or response is None:
+                continue
+            try:
+                translated_content = self._extract_translation_from_response(response)
+            except ValueError:
+                continue
+            
+            if self.validator:
+                if not self.validator.validate_translation(requests[chunk.id], translated_content).is_valid:
+                    continue
+                translated_content = self.validator.remove_markers(translated_content)
+            
+            self._store_in_cache(chunk, translated_content)
+            results[chunk.id] = TranslationResult(
+                chunk_id=chunk.id,
+                original_content=chunk.content,
+                translated_content=translated_content,
+                success=True,
+                sequence_number=chunk.sequence_number,
+                processing_time=time.time() - start_time,
+                status=TranslationStatus.COMPLETED
+            )
+        
+        remaining = [chunk for chunk in chunks if chunk.id not in results]
+        if remaining:
+            self.logger.info("Translating %d chunks not completed by the Batch API live", len(remaining))
+            for result in await self._translate_chunks(remaining):
+                results[result.chunk_id] = result
+        
+        await self._flush_cache()
+        return [results[chunk.id] for chunk in chunks]
+    
+    async def _run_batch_job(self, requests: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Submit translation requests as a Batch API job and wait for it.
+        
+        Args:
+            requests: Content to translate, keyed by chunk ID
+            
+        Returns:
+            Chat completion response body for each chunk ID that succeeded
+            
+        Raises:
+            RuntimeError: If the batch job does not complete
+        """
+        lines = []
+        for chunk_id, content in requests.items():
+            lines.append(json.dumps({
+                "custom_id": chunk_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_params(self._create_translation_prompt(content)),
+            }, ensure_ascii=False))
+        
+        batch_file = await self._call_client(
+            self.api_client.files.create,
+            file=("translation_batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await self._call_client(
+            self.api_client.batches.create,
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.BATCH_API_COMPLETION_WINDOW
+        )
+        self.logger.info("Submitted Batch API job %s with %d requests", batch.id, len(requests))
+        
+        # Poll with exponential backoff until the job reaches a final state
+        poll_interval = self.BATCH_API_POLL_INTERVAL
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, self.BATCH_API_MAX_POLL_INTERVAL)
+            batch = await self._call_client(self.api_client.batches.retrieve, batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch API job {batch.id} ended with status {batch.status}")
+        
+        output_file = await self._call_client(self.api_client.files.content, batch.output_file_id)
+        output = {}
+        for line in output_file.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200 and response.get("body"):
+                output[record["custom_id"]] = response["body"]
+        
+        return output
+    
+    async def _call_client(self, method: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call an API client method, awaiting it directly on an AsyncOpenAI
+        client and in a worker thread on a sync OpenAI client.
+        
+        Args:
+            method: Bound client method to call
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            The method's return value
+        """
+        if isinstance(self.api_client, AsyncOpenAI):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+    
+    def _completion_params(self, prompt: str, system_prompt: str = _SYSTEM_PROMPT) -> Dict[str, Any]:
+        """
+        Build the chat completion request parameters for a prompt.
+        
+        Args:
+            prompt: User message of the translation request
+            system_prompt: Fixed instructions sent ahead of the user message
+            
+        Returns:
+            Request parameters shared by live and Batch API requests
+        """
+        system_message: Dict[str, Any] = {"role": "system", "content": system_prompt}
+        if self._model_name.lower().startswith(self.CACHE_CONTROL_MODEL_PREFIXES):
+            # Opt-in prompt caching for providers that require it
+            system_message["content"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
         
-        return prompt
+        return {
+            "model": self._model_name,
+            "messages": [
+                system_message,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.3,  # Lower temperature for more consistent translations
+            "max_tokens": min(self.MAX_OUTPUT_TOKENS, max(self.MIN_OUTPUT_TOKENS, int(len(prompt) * 1.2))),
+        }
     
-    def _make_api_call_with_retry(self, prompt: str) -> Dict[str, Any]:
+    async def _make_api_call_with_retry(self, prompt: str, system_prompt: str = _SYSTEM_PROMPT) -> Dict[str, Any]:
         """
-        Make synchronous API call to OpenRouter with error handling.
+        Make an API call to OpenRouter with error handling.
+        
+        An AsyncOpenAI client streams the response, see _stream_completion;
+        a sync OpenAI client is run in a worker thread.
         
         Args:
-            prompt: Translation prompt
+            prompt: User message of the translation request
+            system_prompt: Fixed instructions sent ahead of the user message
             
         Returns:
             API response dictionary
@@ -395,28 +1322,112 @@ class TranslationPool(ITranslator):
             Exception: If API call fails
         """
         try:
-            # Get model name from config manager
-            model_name = self.api_client._config_manager.get_model_name()
+            if isinstance(self.api_client, AsyncOpenAI):
+                return await self._stream_completion(prompt, system_prompt)
             
-            response = self.api_client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # Lower temperature for more consistent translations
-                max_tokens=8000,  # Increase max tokens to 8000 for larger content
+            response = await self._call_client(
+                self.api_client.chat.completions.create,
+                **self._completion_params(prompt, system_prompt),
                 timeout=120.0,  # Increase timeout to 120 seconds for slow models
             )
             
-            return response.model_dump()
+            # Copy only the fields used downstream; model_dump() would copy
+            # the whole response object recursively
+            return {
+                "choices": [
+                    {
+                        "index": choice.index,
+                        "message": {"role": choice.message.role, "content": choice.message.content},
+                        "finish_reason": choice.finish_reason,
+                    }
+                    for choice in response.choices
+                ],
+                "usage": response.usage.model_dump() if response.usage is not None else None,
+            }
             
         except Exception as e:
-            self.logger.error(f"API call failed: {e}")
+            self.logger.error("API call failed: %s", e)
             raise
     
+    async def _stream_completion(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
+        """
+        Stream a chat completion and assemble it into a response dictionary.
+        
+        The partial output is security-checked as it arrives, with the rule
+        the finished response is held to (a high-risk validate_api_response
+        result); if it is rejected, the stream is closed so the model stops
+        generating.
+        
+        Args:
+            prompt: User message of the translation request
+            system_prompt: Fixed instructions sent ahead of the user message
+            
+        Returns:
+            API response dictionary in the same shape as a non-streamed one
+            
+        Raises:
+            ValueError: If the partial output fails security validation
+        """
+        stream = await self.api_client.chat.completions.create(
+            **self._completion_params(prompt, system_prompt),
+            stream=True,
+            # Without this, OpenAI-compatible endpoints omit token usage from streams
+            stream_options={"include_usage": True},
+            timeout=120.0,  # Increase timeout to 120 seconds for slow models
+        )
+        
+        parts: List[str] = []
+        received = 0
+        checked = 0
+        unchecked_from = 0  # Index in parts of the first piece not yet checked
+        overlap = ""
+        finish_reason = None
+        usage = None
+        
+        try:
+            async for event in stream:
+                # Providers that report usage send it on the final event
+                if getattr(event, 'usage', None) is not None:
+                    usage = event.usage.model_dump()
+                if not event.choices:
+                    continue
+                
+                choice = event.choices[0]
+                if choice.delta is not None and choice.delta.content:
+                    parts.append(choice.delta.content)
+                    received += len(choice.delta.content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                
+                if self.security_manager and received - checked >= self.STREAM_CHECK_INTERVAL:
+                    # Only the new text is scanned, with an overlap so a pattern
+                    # split across two checks is still seen
+                    window = overlap + "".join(parts[unchecked_from:])
+                    checked = received
+                    unchecked_from = len(parts)
+                    overlap = window[-self.STREAM_CHECK_OVERLAP:]
+                    validation = self.security_manager.validate_api_response(
+                        {"choices": [{"message": {"content": window}}]}
+                    )
+                    if not validation.is_valid and validation.risk_level == 'high':
+                        raise ValueError(
+                            f"Streamed response failed security validation: {', '.join(validation.issues)}"
+                        )
+        finally:
+            # Closing early cancels the rest of the generation upstream
+            await stream.response.aclose()
+        
+        return {
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(parts)},
+                    "finish_reason": finish_reason,
+                }
+            ],
+            "usage": usage,
+        }
+    
     def _extract_translation_from_response(self, response: Dict[str, Any]) -> str:
         """
         Extract translated content from API response.
@@ -444,7 +1455,7 @@ class TranslationPool(ITranslator):
             return content.strip()
             
         except Exception as e:
-            self.logger.error(f"Failed to extract translation from response: {e}")
+            self.logger.error("Failed to extract translation from response: %s", e)
             raise ValueError(f"Invalid API response format: {e}")
     
     def get_concurrency(self) -> int:
@@ -462,19 +1473,72 @@ class TranslationPool(ITranslator):
             raise ValueError("Concurrency must be greater than 0")
         
         self.concurrency = concurrency
-        self.semaphore = asyncio.Semaphore(concurrency)
-        self.logger.info(f"Concurrency updated to {concurrency}")
+        self._wake_waiters()
+        self.logger.info("Concurrency updated to %d", concurrency)
     
-    def get_api_client(self) -> OpenAI:
+    def _adjust_concurrency(self, error_type: Optional[str] = None) -> None:
+        """
+        Adapt concurrency to the outcome of an API call, if enabled.
+        
+        Args:
+            error_type: Classified error of a failed call, None for a success
+        """
+        if not self.adaptive_concurrency:
+            return
+        
+        if error_type is None:
+            self._successes_since_decrease += 1
+            if (self._successes_since_decrease >= self.ADAPTIVE_INCREASE_AFTER and
+                    self.concurrency < self.max_concurrency):
+                self._successes_since_decrease = 0
+                self.set_concurrency(self.concurrency + 1)
+        elif error_type in ("rate_limit", "server_error"):
+            self._successes_since_decrease = 0
+            now = time.monotonic()
+            if now - self._last_decrease >= self.ADAPTIVE_DECREASE_COOLDOWN and self.concurrency > 1:
+                self._last_decrease = now
+                self.set_concurrency(max(1, self.concurrency // 2))
+    
+    def get_model_name(self) -> str:
+        """Get the model used for translation."""
+        return self._model_name
+    
+    def set_model_name(self, model_name: str) -> None:
+        """
+        Set the model used for translation.
+        
+        Args:
+            model_name: Model name as accepted by the API
+        """
+        if not model_name:
+            raise ValueError("Model name cannot be empty")
+        
+        self._model_name = model_name
+        self.logger.info("Model updated to %s", model_name)
+    
+    def _wake_waiters(self) -> None:
+        """Let waiting tasks re-check the concurrency limit after it changes."""
+        async def notify_all() -> None:
+            async with self._slots:
+                self._slots.notify_all()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop means no task can be waiting for a slot
+            return
+        self._wake_task = loop.create_task(notify_all())
+    
+    def get_api_client(self) -> Union[AsyncOpenAI, OpenAI]:
         """Get the current API client."""
         return self.api_client
     
-    def set_api_client(self, api_client: OpenAI) -> None:
+    def set_api_client(self, api_client: Union[AsyncOpenAI, OpenAI]) -> None:
         """
         Set a new API client.
         
         Args:
-            api_client: New OpenAI client instance
+            api_client: New AsyncOpenAI or OpenAI client instance
         """
         if not api_client:
             raise ValueError("API client cannot be None")
@@ -502,25 +1566,25 @@ class TranslationPool(ITranslator):
         Returns:
             Error type string
         """
-        if isinstance(error, RateLimitError):
-            return "rate_limit"
-        elif isinstance(error, APITimeoutError):
-            return "timeout"
-        elif isinstance(error, APIError):
+        for error_class, error_type in _ERROR_TYPES_BY_CLASS:
+            if isinstance(error, error_class):
+                return error_type
+        
+        if isinstance(error, APIError):
             # Check for specific API error codes
-            if hasattr(error, 'status_code'):
-                if error.status_code == 429:
-                    return "rate_limit"
-                elif error.status_code >= 500:
+            status_code = getattr(error, 'status_code', None)
+            if status_code is not None:
+                status_error_type = _ERROR_TYPES_BY_STATUS.get(status_code)
+                if status_error_type:
+                    return status_error_type
+                if status_code >= 500:
                     return "server_error"
-                elif error.status_code == 401:
-                    return "auth_error"
-                elif error.status_code == 400:
-                    return "client_error"
             return "api_error"
-        elif "timeout" in str(error).lower():
+        
+        message = str(error).lower()
+        if "timeout" in message:
             return "timeout"
-        elif "connection" in str(error).lower():
+        elif "connection" in message:
             return "connection_error"
         else:
             return "unknown_error"
@@ -535,10 +1599,7 @@ class TranslationPool(ITranslator):
         Returns:
             True if error is retriable, False otherwise
         """
-        retriable_errors = {
-            "rate_limit", "timeout", "server_error", "connection_error", "unknown_error"
-        }
-        return error_type in retriable_errors
+        return error_type in _RETRIABLE_ERROR_TYPES
     
     async def _apply_retry_delay(self, attempt: int) -> None:
         """
@@ -549,7 +1610,7 @@ class TranslationPool(ITranslator):
         """
         delay = self.retry_strategy.get_delay(attempt)
         if delay > 0:
-            self.logger.debug(f"Applying retry delay: {delay:.2f}s")
+            self.logger.debug("Applying retry delay: %.2fs", delay)
             await asyncio.sleep(delay)
     
     async def _handle_rate_limit_error(self, error: Exception) -> None:
@@ -559,35 +1620,31 @@ class TranslationPool(ITranslator):
         Args:
             error: Rate limit error
         """
-        # Extract retry-after header if available
-        retry_after = 60.0  # Default to 60 seconds
+        # Wait until the latest reset the provider reports, if it reports any
+        delays = []
         
         if hasattr(error, 'response') and error.response:
             headers = getattr(error.response, 'headers', {})
-            if 'retry-after' in headers:
+            for name in _RATE_LIMIT_RESET_HEADERS:
+                value = headers.get(name)
+                if value:
+                    delay = _parse_reset_delay(str(value))
+                    if delay is not None:
+                        delays.append(delay)
+            
+            value = headers.get('retry-after-ms')
+            if value:
                 try:
-                    retry_after = float(headers['retry-after'])
-                except (ValueError, TypeError):
+                    delays.append(float(value) / 1000.0)
+                except ValueError:
                     pass
         
-        self._rate_limit_delay = retry_after
-        self._last_rate_limit_time = time.time()
+        retry_after = max(0.0, max(delays)) if delays else 60.0  # Default to 60 seconds
         
-        self.logger.warning(f"Rate limit hit, will delay requests by {retry_after}s")
-    
-    async def _apply_rate_limit_delay(self) -> None:
-        """Apply rate limiting delay if needed."""
-        if self._rate_limit_delay > 0:
-            elapsed = time.time() - self._last_rate_limit_time
-            remaining_delay = self._rate_limit_delay - elapsed
-            
-            if remaining_delay > 0:
-                self.logger.debug(f"Applying rate limit delay: {remaining_delay:.2f}s")
-                await asyncio.sleep(remaining_delay)
-            else:
-                # Reset rate limit state
-                self._rate_limit_delay = 0.0
-                self._last_rate_limit_time = 0.0
+        # Every task passes the request bucket, so pausing it stalls them all
+        self._rpm_bucket.pause(retry_after)
+        
+        self.logger.warning("Rate limit hit, will delay requests by %ss", retry_after)
     
     def get_retry_strategy(self) -> RetryStrategy:
         """Get the current retry strategy."""
@@ -601,7 +1658,7 @@ class TranslationPool(ITranslator):
             retry_strategy: New retry strategy configuration
         """
         self.retry_strategy = retry_strategy
-        self.logger.info(f"Retry strategy updated: max_retries={retry_strategy.max_retries}")
+        self.logger.info("Retry strategy updated: max_retries=%d", retry_strategy.max_retries)
     
     def get_translation_statistics(self, results: List[TranslationResult]) -> Dict[str, Any]:
         """
@@ -617,22 +1674,25 @@ class TranslationPool(ITranslator):
             return {}
         
         total_results = len(results)
-        successful = sum(1 for r in results if r.success)
-        failed = total_results - successful
+        successful = 0
+        total_retries = 0
+        total_time = 0.0
+        error_types = {}
         
-        total_retries = sum(r.retry_count for r in results)
-        total_time = sum(r.processing_time for r in results)
+        # Counts, totals and error analysis in a single pass
+        for result in results:
+            total_retries += result.retry_count
+            total_time += result.processing_time
+            if result.success:
+                successful += 1
+            elif result.error_message:
+                error_type = "validation_error" if _VALIDATION_ERROR_RE.search(result.error_message) else "api_error"
+                error_types[error_type] = error_types.get(error_type, 0) + 1
         
+        failed = total_results - successful
         avg_time = total_time / total_results if total_results > 0 else 0
         avg_retries = total_retries / total_results if total_results > 0 else 0
         
-        # Error analysis
-        error_types = {}
-        for result in results:
-            if not result.success and result.error_message:
-                error_type = "validation_error" if "validation" in result.error_message.lower() else "api_error"
-                error_types[error_type] = error_types.get(error_type, 0) + 1
-        
         return {
             "total_chunks": total_results,
             "successful_translations": successful,
@@ -5,10 +5,90 @@ This module provides functionality to validate that translated content
 maintains integrity and completeness compared to the original.
 """
 
+import hashlib
+import os
 import re
-from typing import List, Dict, Tuple
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, List, Dict, FrozenSet, Optional, Tuple, Union
 from .interfaces import IValidator
-from .models import ValidationResult
+from .models import ValidationResult, ValidationResultBatch
+
+hyperscan: Optional[ModuleType]
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# The line-level structure patterns of IntegrityValidator._LINE_STRUCTURE_RE,
+# in group order, for the optional Hyperscan scan. Each can match only once
+# per line, at a single end offset, so Hyperscan reports exactly the matches
+# finditer finds. Links and images can overlap, and Hyperscan would report
+# every match end, so they are always counted with re.
+_LINE_STRUCTURE_EXPRESSIONS = (
+    ('header', rb'^#{1,6}\s'),
+    ('table_row', rb'^\|.*\|$'),
+    ('code_block', rb'^(?:```|~~~)\w*$'),
+)
+
+
+def _compile_line_database() -> Any:
+    """
+    Compile the line-level structure patterns into a Hyperscan database.
+    
+    Returns:
+        Hyperscan database, or None when Hyperscan is not installed or
+        does not support this platform
+    """
+    if hyperscan is None:
+        return None
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[expression for _, expression in _LINE_STRUCTURE_EXPRESSIONS],
+            ids=list(range(len(_LINE_STRUCTURE_EXPRESSIONS))),
+            flags=[hyperscan.HS_FLAG_MULTILINE] * len(_LINE_STRUCTURE_EXPRESSIONS),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_LINE_DATABASE = _compile_line_database()
+
+# Hyperscan scratch space cannot be shared between concurrent scans, so each
+# thread scans with its own clone of this one
+_LINE_SCRATCH: Any = hyperscan.Scratch(_LINE_DATABASE) if hyperscan and _LINE_DATABASE else None
+_line_scratch = threading.local()
+
+
+def _hyperscan_count_lines(content: str, counts: Dict[str, int]) -> None:
+    """
+    Count line-level structure elements with the Hyperscan database.
+    
+    Args:
+        content: Content without markers
+        counts: Structure counts to add the line-level elements to
+    """
+    scratch = getattr(_line_scratch, 'scratch', None)
+    if scratch is None:
+        scratch = _line_scratch.scratch = _LINE_SCRATCH.clone()
+    
+    matched = [0] * len(_LINE_STRUCTURE_EXPRESSIONS)
+    
+    def on_match(expression_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        matched[expression_id] += 1
+    
+    # The patterns are ASCII, so they match the UTF-8 bytes where re matches the text
+    _LINE_DATABASE.scan(content.encode('utf-8', 'surrogatepass'),
+                        match_event_handler=on_match, scratch=scratch)
+    for (name, _), count in zip(_LINE_STRUCTURE_EXPRESSIONS, matched):
+        counts[name] += count
 
 
 class IntegrityValidator(IValidator):
@@ -20,30 +100,91 @@ class IntegrityValidator(IValidator):
     It uses integrity markers and various validation checks.
     """
     
-    # Integrity markers used to validate translation completeness
+    # Integrity markers used to validate translation completeness, interned so
+    # every lookup shares a single string object
     INTEGRITY_MARKERS = {
-        'start': '<<<TRANSLATION_START_MARKER>>>',
-        'end': '<<<TRANSLATION_END_MARKER>>>'
+        'start': sys.intern('<<<TRANSLATION_START_MARKER>>>'),
+        'end': sys.intern('<<<TRANSLATION_END_MARKER>>>')
     }
     
-    # Markdown syntax patterns for structure validation
+    # Marker lines wrapped around content by add_markers
+    _START_PREFIX = INTEGRITY_MARKERS['start'] + '\n'
+    _END_SUFFIX = '\n' + INTEGRITY_MARKERS['end']
+    
+    # Line boundaries str.splitlines() recognizes besides "\n"
+    _OTHER_LINE_BREAKS = ('\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029')
+    
+    # Number of validation results kept for reuse
+    VALIDATION_CACHE_SIZE = 512
+    
+    # Marker patterns used by remove_markers when a marker is not simply at the
+    # start or end of the content, compiled once from INTEGRITY_MARKERS
+    _START_MARKER_RE = re.compile('^' + re.escape(INTEGRITY_MARKERS['start']) + r'\n?', re.MULTILINE)
+    _END_MARKER_RE = re.compile(r'\n?' + re.escape(INTEGRITY_MARKERS['end']) + '$', re.MULTILINE)
+    
+    # Markdown syntax patterns for structure validation. Markdown syntax is
+    # ASCII, so the character classes of line-level patterns are ASCII-only.
+    # They stay str patterns: re scans a str in its own storage without
+    # transcoding, so encoding content for bytes patterns only adds a copy
+    # (and makes CJK text 3 bytes per character instead of 2).
     MARKDOWN_PATTERNS = {
-        'code_block': re.compile(r'^```[\w]*$|^~~~[\w]*$', re.MULTILINE),
+        'code_block': re.compile(r'^```[\w]*$|^~~~[\w]*$', re.MULTILINE | re.ASCII),
         'table_row': re.compile(r'^\|.*\|$', re.MULTILINE),
-        'header': re.compile(r'^#{1,6}\s+', re.MULTILINE),
-        'list_item': re.compile(r'^\s*[-*+]\s+|^\s*\d+\.\s+', re.MULTILINE),
+        'header': re.compile(r'^#{1,6}\s+', re.MULTILINE | re.ASCII),
+        'list_item': re.compile(r'^\s*[-*+]\s+|^\s*\d+\.\s+', re.MULTILINE | re.ASCII),
         'link': re.compile(r'\[([^\]]+)\]\(([^)]+)\)'),
         'image': re.compile(r'!\[([^\]]*)\]\(([^)]+)\)'),
     }
     
-    def __init__(self, line_count_tolerance: float = 0.1):
+    # The line-anchored patterns above fused into one alternation. A line can
+    # only start one of them, so a single scan counts each the same as its
+    # own pattern would. Splitting on "\n" and classifying lines in Python
+    # is no faster on chunk-sized content and slower on large documents, and
+    # would have to mirror edge cases such as "\s" matching the newline after
+    # a bare "#", so the scan stays a regex.
+    _LINE_STRUCTURE_RE = re.compile(
+        r'^(?:(?P<header>#{1,6}\s)|(?P<table_row>\|.*\|$)|(?P<code_block>(?:```|~~~)\w*$))',
+        re.MULTILINE | re.ASCII
+    )
+    
+    # Scans run by _count_structure: the fused line-level scan, links and images
+    _ALL_SCANS = frozenset(('line', 'link', 'image'))
+    
+    # How a line matched by _LINE_STRUCTURE_RE begins, on the first line and
+    # on any later one
+    _LINE_STRUCTURE_STARTS = ('#', '|', '```', '~~~')
+    _LINE_STRUCTURE_TOKENS = ('\n#', '\n|', '\n```', '\n~~~')
+    
+    # Inline patterns bound once, so counting does not look them up by name
+    _LINK_RE = MARKDOWN_PATTERNS['link']
+    _IMAGE_RE = MARKDOWN_PATTERNS['image']
+    
+    def __init__(self, line_count_tolerance: float = 0.1, skip_absent_structure: bool = False):
         """
         Initialize the IntegrityValidator.
         
         Args:
             line_count_tolerance: Allowed line count difference as a percentage (default: 10%)
+            skip_absent_structure: Do not scan the translation for structure
+                elements the original has none of, so elements added by the
+                translation go unreported (default: False)
         """
         self.line_count_tolerance = line_count_tolerance
+        self.skip_absent_structure = skip_absent_structure
+        self._validation_cache: 'OrderedDict[Any, ValidationResult]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The result cache and its lock are not pickled; a copy starts empty
+        state = self.__dict__.copy()
+        del state['_validation_cache']
+        del state['_cache_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._validation_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def add_markers(self, content: str) -> str:
         """
@@ -57,19 +198,54 @@ class IntegrityValidator(IValidator):
         """
         if not content.strip():
             return content
-            
-        start_marker = self.INTEGRITY_MARKERS['start']
-        end_marker = self.INTEGRITY_MARKERS['end']
         
         # Add markers with newlines to ensure they're on separate lines
-        marked_content = f"{start_marker}\n{content}\n{end_marker}"
-        
-        return marked_content
+        return self._START_PREFIX + content + self._END_SUFFIX
     
     def validate_translation(self, original: str, translated: str) -> ValidationResult:
         """
         Validate that translated content maintains integrity.
         
+        Args:
+            original: Original content with markers
+            translated: Translated content that should have markers
+            
+        Returns:
+            ValidationResult indicating whether validation passed
+        """
+        # Retries and repeated runs validate the same pair again; results are
+        # reused by digest of both sides and the settings they depend on
+        key = (
+            self.line_count_tolerance,
+            self.skip_absent_structure,
+            hashlib.blake2b(original.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+            hashlib.blake2b(translated.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+        )
+        with self._cache_lock:
+            result = self._validation_cache.get(key)
+            if result is not None:
+                self._validation_cache.move_to_end(key)
+        
+        if result is None:
+            result = self._run_validation(original, translated)
+            with self._cache_lock:
+                self._validation_cache[key] = result
+                if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+        
+        # A copy, so callers cannot modify the cached issue list
+        return ValidationResult(
+            is_valid=result.is_valid,
+            issues=list(result.issues),
+            confidence_score=result.confidence_score,
+            line_count_diff=result.line_count_diff,
+            has_markers=result.has_markers
+        )
+    
+    def _run_validation(self, original: str, translated: str) -> ValidationResult:
+        """
+        Run the validation checks.
+        
         Args:
             original: Original content with markers
             translated: Translated content that should have markers
@@ -91,20 +267,39 @@ class IntegrityValidator(IValidator):
         original_clean = self.remove_markers(original)
         translated_clean = self.remove_markers(translated)
         
-        # Check line count similarity
-        line_count_valid, line_diff = self._check_line_count_similarity(original_clean, translated_clean)
-        if not line_count_valid:
-            issues.append(f"Line count difference too large: {line_diff} lines")
-            confidence_score -= 0.3
-        
-        # Check Markdown structure integrity
-        structure_valid, structure_issues = self._check_markdown_structure(original_clean, translated_clean)
-        if not structure_valid:
-            issues.extend(structure_issues)
-            confidence_score -= 0.2 * len(structure_issues)
+        if original_clean == translated_clean:
+            # Content left unchanged (or empty on both sides) has the same
+            # lines and structure; only one side is counted, for the unclosed
+            # code block check
+            line_diff = 0
+            original_counts = translated_counts = self._count_structure(original_clean)
+        else:
+            # Check line count similarity
+            line_count_valid, line_diff = self._check_line_count_similarity(original_clean, translated_clean)
+            if not line_count_valid:
+                issues.append(f"Line count difference too large: {line_diff} lines")
+                confidence_score -= 0.3
+            
+            # Count structural elements once per side for the checks below.
+            # Matching totals of characters such as '#' or '|' would not prove
+            # the structure matches (a heading marker moved mid-line keeps the
+            # count), so the counts are always taken; _count_structure skips
+            # the scans a side cannot match instead.
+            original_counts = self._count_structure(original_clean)
+            if self.skip_absent_structure:
+                scans = self._prepare_check_plan(original_counts)
+            else:
+                scans = self._ALL_SCANS
+            translated_counts = self._count_structure(translated_clean, scans)
+            
+            # Check Markdown structure integrity
+            structure_valid, structure_issues = self._check_markdown_structure(original_counts, translated_counts)
+            if not structure_valid:
+                issues.extend(structure_issues)
+                confidence_score -= 0.2 * len(structure_issues)
         
         # Check code block integrity
-        code_blocks_valid, code_issues = self._check_code_blocks_integrity(original_clean, translated_clean)
+        code_blocks_valid, code_issues = self._check_code_blocks_integrity(original_counts, translated_counts)
         if not code_blocks_valid:
             issues.extend(code_issues)
             confidence_score -= 0.1 * len(code_issues)
@@ -137,15 +332,31 @@ class IntegrityValidator(IValidator):
         """
         if not content:
             return content
-            
+        
         start_marker = self.INTEGRITY_MARKERS['start']
         end_marker = self.INTEGRITY_MARKERS['end']
         
-        # Remove start marker and any following newline
-        content = re.sub(f'^{re.escape(start_marker)}\\n?', '', content, flags=re.MULTILINE)
-        
-        # Remove end marker and any preceding newline
-        content = re.sub(f'\\n?{re.escape(end_marker)}$', '', content, flags=re.MULTILINE)
+        # Remove start marker and any following newline. The usual case, a
+        # single marker opening the content, is sliced off directly; markers
+        # elsewhere at the start of a line go through the regex.
+        count = content.count(start_marker)
+        if count == 1 and content.startswith(start_marker):
+            cut = len(start_marker)
+            if content.startswith('\n', cut):
+                cut += 1
+            content = content[cut:]
+        elif count:
+            content = self._START_MARKER_RE.sub('', content)
+        
+        # Remove end marker and any preceding newline, likewise
+        count = content.count(end_marker)
+        if count == 1 and content.endswith(end_marker):
+            cut = len(content) - len(end_marker)
+            if content.endswith('\n', 0, cut):
+                cut -= 1
+            content = content[:cut]
+        elif count:
+            content = self._END_MARKER_RE.sub('', content)
         
         return content.strip()
     
@@ -153,16 +364,21 @@ class IntegrityValidator(IValidator):
         """
         Check if both integrity markers are present in the content.
         
+        The end marker is only searched for after the start marker, so the
+        content is scanned once and an end marker that comes before the
+        start marker does not count.
+        
         Args:
             content: Content to check for markers
             
         Returns:
-            True if both markers are present, False otherwise
+            True if both markers are present in order, False otherwise
         """
         start_marker = self.INTEGRITY_MARKERS['start']
         end_marker = self.INTEGRITY_MARKERS['end']
         
-        return start_marker in content and end_marker in content
+        start = content.find(start_marker)
+        return start >= 0 and content.find(end_marker, start + len(start_marker)) >= 0
     
     def _check_line_count_similarity(self, original: str, translated: str) -> Tuple[bool, int]:
         """
@@ -175,8 +391,8 @@ class IntegrityValidator(IValidator):
         Returns:
             Tuple of (is_valid, line_difference)
         """
-        original_lines = len(original.splitlines()) if original else 0
-        translated_lines = len(translated.splitlines()) if translated else 0
+        original_lines = self._count_lines(original)
+        translated_lines = self._count_lines(translated)
         
         line_diff = abs(original_lines - translated_lines)
         
@@ -187,13 +403,108 @@ class IntegrityValidator(IValidator):
         
         return is_valid, line_diff
     
-    def _check_markdown_structure(self, original: str, translated: str) -> Tuple[bool, List[str]]:
+    @classmethod
+    def _prepare_check_plan(cls, original_counts: Dict[str, int]) -> FrozenSet[str]:
+        """
+        Select the scans of the translated content worth running.
+        
+        Args:
+            original_counts: Structure counts of the original content
+            
+        Returns:
+            The scans of _ALL_SCANS that find elements in the original content
+        """
+        scans = set()
+        if original_counts['header'] or original_counts['table_row'] or original_counts['code_block']:
+            scans.add('line')
+        if original_counts['link']:
+            scans.add('link')
+        if original_counts['image']:
+            scans.add('image')
+        return frozenset(scans)
+    
+    def _count_structure(self, content: str, scans: FrozenSet[str] = _ALL_SCANS) -> Dict[str, int]:
+        """
+        Count the Markdown structure elements in content.
+        
+        Args:
+            content: Content without markers
+            scans: Scans to run; elements of the others are counted as 0
+            
+        Returns:
+            Count for each of 'header', 'table_row', 'code_block', 'link' and 'image'
+        """
+        counts = {'header': 0, 'table_row': 0, 'code_block': 0, 'link': 0, 'image': 0}
+        
+        # Every line-level element starts its line with one of a few tokens,
+        # so content without any (including prose with inline code or "C#")
+        # is ruled out by substring tests without a regex scan. Code fences
+        # stay in the fused scan, where they cost no extra pass.
+        if 'line' in scans and (content.startswith(self._LINE_STRUCTURE_STARTS) or
+                                any(token in content for token in self._LINE_STRUCTURE_TOKENS)):
+            if _LINE_DATABASE is not None:
+                _hyperscan_count_lines(content, counts)
+            else:
+                for match in self._LINE_STRUCTURE_RE.finditer(content):
+                    group = match.lastgroup
+                    if group is not None:
+                        counts[group] += 1
+        
+        # Images contain a link, so inline elements are counted separately;
+        # both need a "](" to match at all, and images also a "!["
+        if '](' in content:
+            if 'link' in scans:
+                counts['link'] = self._count_matches(self._LINK_RE, content)
+            if 'image' in scans and '![' in content:
+                counts['image'] = self._count_matches(self._IMAGE_RE, content)
+        return counts
+    
+    @staticmethod
+    def _count_matches(pattern: 're.Pattern', content: str) -> int:
+        """
+        Count non-overlapping matches without building a list of them.
+        
+        Args:
+            pattern: Compiled pattern to count
+            content: Content to search
+            
+        Returns:
+            Number of matches, as len(pattern.findall(content)) would give
+        """
+        count = 0
+        for _ in pattern.finditer(content):
+            count += 1
+        return count
+    
+    @classmethod
+    def _count_lines(cls, content: str) -> int:
+        """
+        Count lines as len(content.splitlines()) would, without building the list.
+        
+        Args:
+            content: Content to count
+            
+        Returns:
+            Number of lines
+        """
+        if not content:
+            return 0
+        
+        # Content that breaks lines only with "\n" is counted directly
+        for line_break in cls._OTHER_LINE_BREAKS:
+            if line_break in content:
+                return len(content.splitlines())
+        
+        return content.count('\n') + (not content.endswith('\n'))
+    
+    def _check_markdown_structure(self, original_counts: Dict[str, int],
+                                  translated_counts: Dict[str, int]) -> Tuple[bool, List[str]]:
         """
         Check if Markdown structure elements are preserved.
         
         Args:
-            original: Original content without markers
-            translated: Translated content without markers
+            original_counts: Structure counts of the original content
+            translated_counts: Structure counts of the translated content
             
         Returns:
             Tuple of (is_valid, list_of_issues)
@@ -201,70 +512,99 @@ class IntegrityValidator(IValidator):
         issues = []
         
         # Check headers count
-        original_headers = len(self.MARKDOWN_PATTERNS['header'].findall(original))
-        translated_headers = len(self.MARKDOWN_PATTERNS['header'].findall(translated))
+        original_headers = original_counts['header']
+        translated_headers = translated_counts['header']
         
         if original_headers != translated_headers:
             issues.append(f"Header count mismatch: original {original_headers}, translated {translated_headers}")
         
         # Check table rows count
-        original_tables = len(self.MARKDOWN_PATTERNS['table_row'].findall(original))
-        translated_tables = len(self.MARKDOWN_PATTERNS['table_row'].findall(translated))
+        original_tables = original_counts['table_row']
+        translated_tables = translated_counts['table_row']
         
         if original_tables != translated_tables:
             issues.append(f"Table row count mismatch: original {original_tables}, translated {translated_tables}")
         
         # Check links count (should be preserved)
-        original_links = len(self.MARKDOWN_PATTERNS['link'].findall(original))
-        translated_links = len(self.MARKDOWN_PATTERNS['link'].findall(translated))
+        original_links = original_counts['link']
+        translated_links = translated_counts['link']
         
         if original_links != translated_links:
             issues.append(f"Link count mismatch: original {original_links}, translated {translated_links}")
         
         # Check images count (should be preserved)
-        original_images = len(self.MARKDOWN_PATTERNS['image'].findall(original))
-        translated_images = len(self.MARKDOWN_PATTERNS['image'].findall(translated))
+        original_images = original_counts['image']
+        translated_images = translated_counts['image']
         
         if original_images != translated_images:
             issues.append(f"Image count mismatch: original {original_images}, translated {translated_images}")
         
         return len(issues) == 0, issues
     
-    def _check_code_blocks_integrity(self, original: str, translated: str) -> Tuple[bool, List[str]]:
+    def _check_code_blocks_integrity(self, original_counts: Dict[str, int],
+                                     translated_counts: Dict[str, int]) -> Tuple[bool, List[str]]:
         """
         Check if code blocks are preserved correctly.
         
         Args:
-            original: Original content without markers
-            translated: Translated content without markers
+            original_counts: Structure counts of the original content
+            translated_counts: Structure counts of the translated content
             
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
         issues = []
         
-        # Find code block markers
-        original_code_markers = self.MARKDOWN_PATTERNS['code_block'].findall(original)
-        translated_code_markers = self.MARKDOWN_PATTERNS['code_block'].findall(translated)
+        # Code block markers
+        original_code_markers = original_counts['code_block']
+        translated_code_markers = translated_counts['code_block']
         
-        if len(original_code_markers) != len(translated_code_markers):
-            issues.append(f"Code block marker count mismatch: original {len(original_code_markers)}, translated {len(translated_code_markers)}")
+        if original_code_markers != translated_code_markers:
+            issues.append(f"Code block marker count mismatch: original {original_code_markers}, translated {translated_code_markers}")
         
         # Check if code blocks are properly closed (even number of markers)
-        if len(original_code_markers) % 2 != 0:
+        if original_code_markers % 2 != 0:
             issues.append("Original content has unclosed code blocks")
         
-        if len(translated_code_markers) % 2 != 0:
+        if translated_code_markers % 2 != 0:
             issues.append("Translated content has unclosed code blocks")
         
         return len(issues) == 0, issues
     
-    def get_validation_statistics(self, validation_results: List[ValidationResult]) -> Dict[str, float]:
+    def validate_many(self, pairs: List[Tuple[str, str]],
+                      workers: Optional[int] = None) -> List[ValidationResult]:
+        """
+        Validate many translations, spread across worker processes.
+        
+        Validation is pure-Python regex and string work that holds the GIL,
+        so pairs are validated in separate processes, each with its own copy
+        of this validator.
+        
+        Args:
+            pairs: (original, translated) pairs, as for validate_translation
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            ValidationResult for each pair, in the order of pairs
+        """
+        workers = min(workers or os.cpu_count() or 1, len(pairs))
+        if workers <= 1:
+            return [self.validate_translation(original, translated) for original, translated in pairs]
+        
+        chunksize = max(1, len(pairs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_validate_in_worker, pairs, chunksize=chunksize))
+    
+    def get_validation_statistics(
+        self, validation_results: Union[List[ValidationResult], ValidationResultBatch]
+    ) -> Dict[str, float]:
         """
         Generate statistics from multiple validation results.
         
         Args:
-            validation_results: List of ValidationResult objects
+            validation_results: List of ValidationResult objects, or a
+                ValidationResultBatch holding them column by column
             
         Returns:
             Dictionary containing validation statistics
@@ -273,11 +613,25 @@ class IntegrityValidator(IValidator):
             return {}
         
         total_validations = len(validation_results)
-        successful_validations = sum(1 for result in validation_results if result.is_valid)
         
-        avg_confidence = sum(result.confidence_score for result in validation_results) / total_validations
+        if isinstance(validation_results, ValidationResultBatch):
+            # Columns are typed arrays, so each total is a single C-level sum
+            successful_validations = sum(validation_results.is_valid)
+            total_confidence = sum(validation_results.confidence)
+            total_issues = sum(validation_results.issue_counts)
+        else:
+            successful_validations = 0
+            total_confidence = 0.0
+            total_issues = 0
+            
+            # All totals in a single pass over the results
+            for result in validation_results:
+                if result.is_valid:
+                    successful_validations += 1
+                total_confidence += result.confidence_score
+                total_issues += len(result.issues)
         
-        total_issues = sum(len(result.issues) for result in validation_results)
+        avg_confidence = total_confidence / total_validations
         
         return {
             'total_validations': total_validations,
@@ -287,3 +641,36 @@ class IntegrityValidator(IValidator):
             'total_issues_found': total_issues,
             'average_issues_per_validation': total_issues / total_validations
         }
+
+
+# Validator of the current worker process, set up by _init_worker
+_worker_validator: Optional[IntegrityValidator] = None
+
+
+def _init_worker(validator: IntegrityValidator) -> None:
+    """
+    Install the validator a validate_many worker process uses.
+    
+    Args:
+        validator: Unpickled copy of the validator validate_many was called on
+    """
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_in_worker(pair: Tuple[str, str]) -> ValidationResult:
+    """
+    Validate one (original, translated) pair in a validate_many worker process.
+    
+    Args:
+        pair: Original and translated content
+        
+    Returns:
+        ValidationResult for the pair
+        
+    Raises:
+        RuntimeError: If the worker was started without _init_worker
+    """
+    if _worker_validator is None:
+        raise RuntimeError("Validation worker has not been initialized")
+    return _worker_validator.validate_translation(*pair)
@@ -0,0 +1,83 @@
+"""Tests for the translation cache."""
+
+import hashlib
+
+import pytest
+
+from markdown_translator import cache as cache_module
+from markdown_translator.cache import TranslationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    translation_cache = TranslationCache(str(tmp_path / "translations.sqlite3"))
+    yield translation_cache
+    translation_cache.close()
+
+
+def test_make_key_is_stable():
+    key = TranslationCache.make_key("model", "prompt", "system")
+
+    assert key == TranslationCache.make_key("model", "prompt", "system")
+    assert key == hashlib.sha256("model\0systemprompt".encode('utf-8')).digest()
+
+
+@pytest.mark.parametrize("other", [
+    ("other-model", "prompt", "system"),
+    ("model", "other prompt", "system"),
+    ("model", "prompt", "other system"),
+])
+def test_make_key_depends_on_every_input(other):
+    assert TranslationCache.make_key("model", "prompt", "system") != TranslationCache.make_key(*other)
+
+
+def test_set_and_get(cache):
+    key = TranslationCache.make_key("model", "prompt")
+    cache.set(key, "译文")
+
+    assert cache.get(key) == "译文"
+    assert cache.get(TranslationCache.make_key("model", "other")) is None
+
+
+def test_entries_expire_after_max_age(cache, monkeypatch):
+    key = TranslationCache.make_key("model", "prompt")
+    cache.set(key, "译文")
+    cache.max_age = 60
+
+    assert cache.get(key) == "译文"
+
+    now = cache_module.time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 120)
+    assert cache.get(key) is None
+    assert cache.get_many([key]) == {}
+
+
+def test_get_many_spans_several_lookup_batches(cache):
+    count = 2 * cache_module._LOOKUP_BATCH_SIZE + 7
+    entries = [(TranslationCache.make_key("model", f"prompt {i}"), f"译文 {i}") for i in range(count)]
+    cache.set_many(entries)
+    missing = TranslationCache.make_key("model", "missing")
+
+    found = cache.get_many([key for key, _ in entries] + [missing])
+
+    assert found == dict(entries)
+
+
+@pytest.mark.parametrize("content, equivalent", [
+    ("x \ny\n", "x\ny"),
+    ("x\n\n\n\ny", "x\n\ny"),
+    ("\n\nx\ny\n\n", "x\ny"),
+    ("x   \ny", "x  \ny"),
+    ("x\t  \ny", "x  \ny"),
+])
+def test_near_key_ignores_insignificant_whitespace(content, equivalent):
+    assert TranslationCache.make_near_key("model", content) == TranslationCache.make_near_key("model", equivalent)
+
+
+@pytest.mark.parametrize("content, different", [
+    ("x  \ny", "x\ny"),
+    ("x  \ny", "x \ny"),
+    ("x\ny 1", "x\ny 2"),
+])
+def test_near_key_keeps_hard_breaks_and_text(content, different):
+    assert TranslationCache.make_near_key("model", content) != TranslationCache.make_near_key("model", different)
@@ -0,0 +1,15 @@
+"""Tests for the security utilities."""
+
+import pytest
+
+from markdown_translator.security import SecurityManager
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("bearer password=hunter2", "bearer [REDACTED][REDACTED]"),
+    ("Bearer secret_token=xyz", "Bearer [REDACTED][REDACTED]"),
+    ("api_key=abc123 other", "api_key[REDACTED] other"),
+    ("Authorization: Bearer abc", "Authorization: [REDACTED]"),
+])
+def test_sanitize_log_content_redacts_every_pattern(content, expected):
+    assert SecurityManager().sanitize_log_content(content) == expected
@@ -0,0 +1,67 @@
+"""Tests for batched translation requests."""
+
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+
+from markdown_translator.models import FileChunk
+from markdown_translator.translator import TranslationPool
+
+
+@pytest.fixture
+def pool():
+    return TranslationPool(api_client=AsyncOpenAI(api_key="test", base_url="http://localhost"),
+                           model_name="test-model")
+
+
+def test_batch_prompt_round_trips(pool):
+    contents = ["# One\n\nfirst", "second", "- third"]
+    prompt = pool._create_batch_translation_prompt(contents)
+
+    assert "<<<CHUNK id=1>>>\n# One\n\nfirst\n<<<END 1>>>" in prompt
+    assert pool._split_batch_translation(prompt, len(contents)) == contents
+
+
+def test_split_batch_translation_marks_missing_part(pool):
+    translated = "<<<CHUNK id=1>>>\n一\n<<<END 1>>>\n\n<<<CHUNK id=3>>>\n三\n<<<END 3>>>"
+
+    assert pool._split_batch_translation(translated, 3) == ["一", None, "三"]
+
+
+def test_split_batch_translation_marks_empty_part(pool):
+    translated = "<<<CHUNK id=1>>>\n一\n<<<END 1>>>\n\n<<<CHUNK id=2>>>\n  \n<<<END 2>>>"
+
+    assert pool._split_batch_translation(translated, 2) == ["一", None]
+
+
+def test_split_batch_translation_orders_parts_by_id(pool):
+    translated = ("<<<CHUNK id=2>>>\n二\n<<<END 2>>>\n\n<<<CHUNK id=1>>>\n一\n<<<END 1>>>\n\n"
+                  "<<<CHUNK id=9>>>\n九\n<<<END 9>>>")
+
+    assert pool._split_batch_translation(translated, 2) == ["一", "二"]
+
+
+def test_split_batch_translation_ignores_unterminated_part(pool):
+    translated = "<<<CHUNK id=1>>>\n一\n<<<END 1>>>\n\n<<<CHUNK id=2>>>\n二，未完"
+
+    assert pool._split_batch_translation(translated, 2) == ["一", None]
+
+
+def test_batch_input_fits_output_budget():
+    assert TranslationPool.MAX_BATCH_TOKENS * TranslationPool.BATCH_OUTPUT_RATIO <= TranslationPool.MAX_OUTPUT_TOKENS
+
+
+def test_truncated_batch_shrinks_later_batches(pool):
+    chunks = [FileChunk(f"c{i}", f"text {i}\n", 1, 1, "doc.md", i) for i in range(3)]
+
+    async def truncated_response(prompt, system_prompt):
+        content = "<<<CHUNK id=1>>>\n文本 0\n<<<END 1>>>\n\n<<<CHUNK id=2>>>\n文本"
+        return {"choices": [{"message": {"content": content}, "finish_reason": "length"}]}
+
+    pool._make_api_call_with_retry = truncated_response
+    results = asyncio.run(pool._translate_batch(chunks))
+
+    assert results[0] is not None and results[0].translated_content == "文本 0"
+    assert results[1:] == [None, None]
+    assert pool._max_batch_tokens == TranslationPool.MAX_BATCH_TOKENS // 2